@@ -6,6 +6,9 @@ The SQLite database is stored at  .data/.nav.db  (hidden from project listing).
 
 Dependencies (all available in base Python + Flask):
   flask, requests  — everything else is stdlib
+  redis (optional) — shared rate-limit counters when RATELIMIT_STORAGE_URI is reachable
+  orjson (optional) — faster JSON encode/decode for every jsonify()/get_json()
+  brotli (optional) — "br" response encoding for clients that accept it (gzip otherwise)
 
 Public endpoints
   GET  /                          SPA shell
@@ -25,26 +28,41 @@ Admin (server-session authenticated)
 
 # ── Standard library ───────────────────────────────────────────────────────
 import csv
+import gzip
 import hashlib
 import io
 import logging
 import os
-import re
 import secrets
 import sqlite3
 import threading
 import time
 import uuid
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
 from functools import wraps
+from pathlib import Path
 
 # ── Third-party (only Flask + requests required) ────────────────────────────
-from flask import Flask, Response, g, jsonify, render_template, request, session
+from flask import Flask, Response, current_app, g, jsonify, request, session
+from flask.json.provider import DefaultJSONProvider
+
+try:                                # optional — Rust JSON codec, stdlib otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+try:                                # optional — Brotli response encoding, gzip only otherwise
+    import brotli
+except ImportError:
+    brotli = None
 
 # ── Project modules ────────────────────────────────────────────────────────
 from routing_engine import (
     CITY_SEARCH_RADIUS_M,
     _extract_poi_keyword,
+    _snap_to_road,
     fetch_routes,
     geocode,
     get_suggestions,
@@ -72,18 +90,29 @@ _SUGGESTION_LIMIT      = 8
 _NEARBY_RADIUS_MIN     = 100
 _NEARBY_RADIUS_DEFAULT = 25_000
 
+# C0 control characters (minus \t \n \r) and DEL, deleted by str.translate
+_CTRL_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f], None)
+
+_IO_POOL_WORKERS       = 8     # shared pool for overlapping upstream calls
+_SINGLEFLIGHT_WAIT_S   = 30.0  # max time a coalesced follower waits on the leader
+
+_RATELIMIT_STORAGE_ENV     = "RATELIMIT_STORAGE_URI"
+_RATELIMIT_STORAGE_DEFAULT = "redis://localhost:6379/0"
+
 _RENDER_ENV_VAR        = "RENDER"
 _DEFAULT_PORT          = 5000
-_CERT_PATH = os.path.join(os.path.dirname(__file__), "certs", "cert.pem")
-_KEY_PATH  = os.path.join(os.path.dirname(__file__), "certs",  "key.pem")
+_BASE_DIR      = Path(__file__).resolve().parent
+_CERT_PATH     = _BASE_DIR / "certs" / "cert.pem"
+_KEY_PATH      = _BASE_DIR / "certs" / "key.pem"
 
-_ALLOWED_CORS_ORIGINS = {
+_ALLOWED_CORS_ORIGINS = frozenset({
     "https://smartnav-ai.onrender.com",
     "http://localhost:5000",
     "https://localhost:5000",
     "http://127.0.0.1:5000",
     "https://127.0.0.1:5000",
-}
+})
 
 # ===========================================================================
 # Content-Security-Policy  (single header string — no flask-talisman needed)
@@ -124,14 +153,24 @@ _CSP = (
 # NATIVE CORS  (replaces flask-cors)
 # ===========================================================================
 
+# Origin-independent CORS headers, serialised once at import
+_CORS_HEADERS: tuple[tuple[str, str], ...] = (
+    ("Access-Control-Allow-Credentials", "true"),
+    ("Access-Control-Allow-Methods",     "GET,POST,OPTIONS"),
+    ("Access-Control-Allow-Headers",     "Content-Type,Authorization"),
+    ("Vary",                             "Origin"),
+)
+
+
 def _apply_cors(response):
-    origin = request.headers.get("Origin", "")
-    if origin in _ALLOWED_CORS_ORIGINS:
-        response.headers["Access-Control-Allow-Origin"]      = origin
-        response.headers["Access-Control-Allow-Credentials"] = "true"
-        response.headers["Access-Control-Allow-Methods"]     = "GET,POST,OPTIONS"
-        response.headers["Access-Control-Allow-Headers"]     = "Content-Type,Authorization"
-        response.headers["Vary"]                             = "Origin"
+    # Same-origin page loads send no Origin header — bail out before any
+    # header work.  Exact set membership only; no per-request regex matching.
+    origin = request.environ.get("HTTP_ORIGIN")
+    if origin and origin in _ALLOWED_CORS_ORIGINS:
+        headers = response.headers
+        headers["Access-Control-Allow-Origin"] = origin
+        for name, value in _CORS_HEADERS:
+            headers[name] = value
     return response
 
 
@@ -139,19 +178,76 @@ def _apply_cors(response):
 # NATIVE SECURITY HEADERS  (replaces flask-talisman)
 # ===========================================================================
 
+_PERMISSIONS_POLICY = "geolocation=(self), camera=(), microphone=()"
+
+# Every value is a final header string — nothing is rebuilt per response
+_SECURITY_HEADERS: tuple[tuple[str, str], ...] = (
+    ("X-Content-Type-Options",  "nosniff"),
+    ("X-XSS-Protection",        "1; mode=block"),
+    ("X-Frame-Options",         "SAMEORIGIN"),
+    ("Referrer-Policy",         "strict-origin-when-cross-origin"),
+    ("Permissions-Policy",      _PERMISSIONS_POLICY),
+    ("Content-Security-Policy", _CSP),
+)
+
+
 def _apply_security_headers(response):
-    response.headers["X-Content-Type-Options"]    = "nosniff"
-    response.headers["X-XSS-Protection"]          = "1; mode=block"
-    response.headers["X-Frame-Options"]           = "SAMEORIGIN"
-    response.headers["Referrer-Policy"]           = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"]        = "geolocation=(self), camera=(), microphone=()"
-    response.headers["Content-Security-Policy"]   = _CSP
+    headers = response.headers
+    for name, value in _SECURITY_HEADERS:
+        headers[name] = value
+    return response
+
+
+# ===========================================================================
+# NATIVE RESPONSE COMPRESSION  (replaces flask-compress)
+# br (when brotli is installed) or gzip for dynamic JSON/HTML/CSV bodies —
+# /route geometry arrays shrink 5-10×.  Static files are direct_passthrough
+# and always go out as-is.
+# ===========================================================================
+
+_COMPRESS_MIN_SIZE  = 1024
+_COMPRESS_LEVEL     = 4
+_BROTLI_QUALITY     = 5     # ≈ gzip-4 speed, smaller output
+_COMPRESS_MIMETYPES = frozenset({"application/json", "text/html", "text/csv"})
+
+
+def _response_encoding() -> str | None:
+    """Best encoding the client accepts — "br", "gzip", or None for identity."""
+    accepted = {part.split(";", 1)[0].strip()
+                for part in request.headers.get("Accept-Encoding", "").lower().split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress_response(response):
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in _COMPRESS_MIMETYPES):
+        return response
+    response.vary.add("Accept-Encoding")
+    encoding = _response_encoding()
+    if encoding is None:
+        return response
+    data = response.get_data()
+    if len(data) < _COMPRESS_MIN_SIZE:
+        return response
+    if encoding == "br":
+        response.set_data(brotli.compress(data, quality=_BROTLI_QUALITY))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=_COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = encoding
     return response
 
 
 # ===========================================================================
 # NATIVE RATE LIMITER  (replaces flask-limiter)
-# Thread-safe sliding-window rate limiter keyed on client IP
+# Sliding-window rate limiter keyed on client IP.  Counters live in Redis
+# when RATELIMIT_STORAGE_URI is reachable (shared by every gunicorn worker),
+# otherwise in this process's memory.
 # ===========================================================================
 
 class _RateLimiter:
@@ -181,7 +277,52 @@ class _RateLimiter:
                 del self._hits[k]
 
 
-_limiter = _RateLimiter()
+class _RedisRateLimiter:
+    """Moving-window limiter on a Redis sorted set per key (one ZSET member per hit)."""
+
+    # Prune, count and record atomically so concurrent workers cannot overshoot
+    _SCRIPT = """
+        redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+        if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then return 0 end
+        redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+        redis.call('PEXPIRE', KEYS[1], math.ceil(ARGV[2] * 1000))
+        return 1
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._hit = client.register_script(self._SCRIPT)
+
+    def is_allowed(self, key: str, limit: int, window_s: float) -> bool:
+        now = time.time()   # wall clock — shared across processes/hosts
+        try:
+            return bool(self._hit(keys=[f"snav:rl:{key}"],
+                                  args=[now, window_s, limit, f"{now}:{uuid.uuid4().hex}"]))
+        except Exception as exc:
+            # Fail open: a Redis hiccup must not take the API down
+            log.warning("rate-limit  redis error, allowing request: %s", exc)
+            return True
+
+    def cleanup(self):
+        pass  # keys expire on their own via PEXPIRE
+
+
+def _make_limiter():
+    uri = os.environ.get(_RATELIMIT_STORAGE_ENV, _RATELIMIT_STORAGE_DEFAULT)
+    if uri.startswith("memory://"):
+        return _RateLimiter()
+    try:
+        import redis
+        client = redis.Redis.from_url(uri, socket_timeout=0.5, socket_connect_timeout=0.5)
+        client.ping()
+    except Exception as exc:
+        log.warning("rate-limit  %s unavailable (%s) — using per-process memory", uri, exc)
+        return _RateLimiter()
+    log.info("rate-limit  storage=%s", uri)
+    return _RedisRateLimiter(client)
+
+
+_limiter = _make_limiter()
 
 
 def _bg_cleanup():
@@ -193,16 +334,27 @@ def _bg_cleanup():
 threading.Thread(target=_bg_cleanup, daemon=True).start()
 
 
+# Paths never written to the request log
+_SKIP_LOG_PATHS = frozenset({"/static", "/api/beacon", "/api/fingerprint", "/"})
+
+
+def _client_ip() -> str:
+    """First X-Forwarded-For hop (or REMOTE_ADDR), resolved once per request and kept on g."""
+    ip = g.get("client_ip")
+    if ip is None:
+        environ = request.environ
+        raw = environ.get("HTTP_X_FORWARDED_FOR") or environ.get("REMOTE_ADDR") or "127.0.0.1"
+        ip = g.client_ip = raw.split(",", 1)[0].strip()
+    return ip
+
+
 def _rate_limit(limit: int, window_s: float):
     """Decorator: returns 429 if IP exceeds `limit` requests per `window_s` seconds."""
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            ip = (
-                request.headers.get("X-Forwarded-For", request.remote_addr) or "127.0.0.1"
-            ).split(",")[0].strip()
             # Use route + IP as key so limits are per-endpoint
-            key = f"{request.endpoint}:{ip}"
+            key = f"{request.endpoint}:{_client_ip()}"
             if not _limiter.is_allowed(key, limit, window_s):
                 return jsonify({"error": "Too many requests"}), 429
             return fn(*args, **kwargs)
@@ -538,6 +690,83 @@ def _log_request_bg(endpoint: str, method: str, ip: str,
     threading.Thread(target=_do, daemon=True).start()
 
 
+# ===========================================================================
+# Shared upstream I/O pool
+# Lets a handler overlap independent upstream calls (e.g. geocoding the
+# destination while the start point is snapped) instead of stacking them.
+# ===========================================================================
+
+_io_pool = ThreadPoolExecutor(max_workers=_IO_POOL_WORKERS, thread_name_prefix="snav-io")
+
+
+# ===========================================================================
+# Single-flight request coalescing
+# Concurrent identical requests (many users typing "mum" inside the same
+# debounce window) share one upstream call: the first caller runs it, the
+# rest wait on its Future and receive the same result.
+# ===========================================================================
+
+class _SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            fut = self._calls.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._calls[key] = Future()
+        if not leader:
+            try:
+                return fut.result(timeout=_SINGLEFLIGHT_WAIT_S)
+            except FuturesTimeout:
+                return fn(*args, **kwargs)   # leader is stuck — go it alone
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+_inflight = _SingleFlight()
+
+
+# ===========================================================================
+# Route planning  (geocode → snap → fetch → score; request-context free
+# so it can run once on behalf of several coalesced /route callers)
+# ===========================================================================
+
+def _plan_route(dest: str, user_lat, user_lon) -> tuple:
+    """Return ``(payload, status)`` for a ``/route`` request."""
+    # Snap the start point while the destination geocodes — the two
+    # upstream calls are independent, so latency is max() not sum().
+    f_snap = None
+    if user_lat is not None and user_lon is not None:
+        f_snap = _io_pool.submit(_snap_to_road, user_lat, user_lon)
+    coords = geocode(dest, user_lat=user_lat, user_lon=user_lon)
+    if not coords:
+        return {"error": f'Could not find "{dest}"'}, 404
+    if f_snap is None:
+        return {"error": "user location required for routing"}, 400
+    raw = fetch_routes(user_lat, user_lon, coords["lat"], coords["lon"],
+                       snapped_start=f_snap.result())
+    if not raw:
+        return {"error": "No routes found"}, 404
+    # fetch_routes output is already normalised at the OSRM parse boundary
+    # (float distance/duration, ≥ 2 decoded coordinates), so it goes to the
+    # scorer as-is instead of being rebuilt point by point.
+    log.info("route  '%s'  %.4f,%.4f  %d route(s)",
+             dest, coords["lat"], coords["lon"], len(raw))
+    return {"destination": coords, "routes": score_routes(raw)}, 200
+
+
 # ===========================================================================
 # Input sanitisers
 # ===========================================================================
@@ -545,15 +774,18 @@ def _log_request_bg(endpoint: str, method: str, ip: str,
 def _sanitize_text(value, max_len: int = _TEXT_MAX_LEN) -> str:
     if not isinstance(value, str):
         value = "" if value is None else str(value)
-    value = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", value)
-    return value[:max_len].strip()
+    return value.translate(_CTRL_TABLE)[:max_len].strip()
 
 
 def _parse_coord(value, name: str, lo: float, hi: float) -> float:
-    try:
-        f = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"'{name}' must be a number")
+    # JSON bodies already decode coordinates to float — use them as-is
+    if type(value) is float:
+        f = value
+    else:
+        try:
+            f = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"'{name}' must be a number")
     if not lo <= f <= hi:
         raise ValueError(f"'{name}' out of range [{lo}, {hi}]")
     return f
@@ -568,6 +800,65 @@ def _parse_optional_coord(value, name: str, lo: float, hi: float):
         return None
 
 
+# Declarative body schemas: (field, lo, hi) validated in a single pass
+_ROUTE_COORDS_FIELDS = (
+    ("start_lat", -90, 90),
+    ("start_lon", -180, 180),
+    ("end_lat",   -90, 90),
+    ("end_lon",   -180, 180),
+)
+
+
+def _json_body() -> dict:
+    """Parsed JSON object body, or {} for missing / malformed / non-object JSON."""
+    body = request.get_json(silent=True)
+    return body if isinstance(body, dict) else {}
+
+
+def _parse_coord_fields(body: dict, fields) -> tuple:
+    """Validate every (name, lo, hi) field of *body*; raises ValueError on the first failure."""
+    return tuple(_parse_coord(body.get(name), name, lo, hi) for name, lo, hi in fields)
+
+
+# ===========================================================================
+# JSON provider  (orjson when installed — large /route geometry payloads)
+# ===========================================================================
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encode/decode in one native pass."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("indent"):
+            opts |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            opts |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=opts).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _json_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return current_app.json.dumps(obj).encode()
+
+
+def _routes_response(routes: list, destination=None) -> Response:
+    """
+    ``{"routes": [...], "destination": {...}}`` as a JSON response.
+
+    The envelope is fixed, so only its two values go through the encoder
+    and the outer object is spliced together from byte literals.
+    """
+    parts = [b'{"routes":', _json_bytes(routes)]
+    if destination is not None:
+        parts += (b',"destination":', _json_bytes(destination))
+    parts.append(b"}")
+    return Response(b"".join(parts), mimetype="application/json")
+
+
 # ===========================================================================
 # App factory
 # ===========================================================================
@@ -580,25 +871,25 @@ def create_app() -> Flask:
     application.config["SESSION_COOKIE_SAMESITE"]    = "Lax"
     application.config["SESSION_COOKIE_SECURE"]      = False  # set True behind HTTPS proxy
     application.config["PERMANENT_SESSION_LIFETIME"] = 3600
+    if orjson is not None:
+        application.json = _OrjsonProvider(application)
 
-    # Apply CORS + security headers on every response; log API requests
+    # Apply CORS + security headers + compression on every response; log API requests
     @application.after_request
     def _after(response):
         # Log API calls (skip static, beacon, fingerprint to reduce noise)
-        _skip_log = {"/static", "/api/beacon", "/api/fingerprint", "/"}
         if (hasattr(g, "_req_start")
                 and not request.path.startswith("/static")
-                and request.path not in _skip_log):
+                and request.path not in _SKIP_LOG_PATHS):
             dur = (time.monotonic() - g._req_start) * 1000
-            ip  = (request.headers.get("X-Forwarded-For", request.remote_addr) or "").split(",")[0].strip()
             _log_request_bg(
                 request.endpoint or request.path,
-                request.method, ip,
+                request.method, _client_ip(),
                 session.get("vid", ""),
                 response.status_code, dur)
         _apply_cors(response)
         _apply_security_headers(response)
-        return response
+        return _compress_response(response)
 
     # Handle CORS pre-flight globally
     @application.before_request
@@ -617,11 +908,8 @@ def create_app() -> Flask:
         if "vid" not in session:
             session["vid"] = uuid.uuid4().hex
             session.permanent = True
-        ip = (
-            request.headers.get("X-Forwarded-For", request.remote_addr) or ""
-        ).split(",")[0].strip()
         ua = request.headers.get("User-Agent", "")
-        _upsert_session(session["vid"], ip, ua)
+        _upsert_session(session["vid"], _client_ip(), ua)
 
     _register_routes(application)
     return application
@@ -630,71 +918,59 @@ def create_app() -> Flask:
 def _register_routes(application: Flask) -> None:
 
     # ── Public SPA ─────────────────────────────────────────────────────────
+    # The shell has no Jinja markup, so it is read (and compressed) once and
+    # served as bytes.  "private": the response may carry the session
+    # Set-Cookie, which must never be stored by a shared proxy cache.
+    index_path = os.path.join(application.root_path, application.template_folder,
+                              "index.html")
+    with open(index_path, "rb") as fh:
+        index_html = fh.read()
+    index_encoded = {"gzip": gzip.compress(index_html, compresslevel=9)}
+    if brotli is not None:
+        index_encoded["br"] = brotli.compress(index_html, quality=11)
+    index_etag = hashlib.sha256(index_html).hexdigest()[:32]
+
     @application.get("/")
     def index():
-        return render_template("index.html")
+        encoding = _response_encoding()
+        if encoding is not None:
+            resp = Response(index_encoded[encoding], mimetype="text/html")
+            resp.headers["Content-Encoding"] = encoding
+            resp.set_etag(f"{index_etag}-{encoding}")
+        else:
+            resp = Response(index_html, mimetype="text/html")
+            resp.set_etag(index_etag)
+        resp.headers["Cache-Control"] = "private, max-age=300"
+        resp.vary.add("Accept-Encoding")
+        return resp.make_conditional(request)
 
     # ── Routing ─────────────────────────────────────────────────────────────
     @application.post("/route")
     @_rate_limit(30, 60)
     def route():
-        body = request.get_json(silent=True) or {}
+        body = _json_body()
         dest = _sanitize_text(body.get("destination", ""))
         if not dest:
             return jsonify({"error": "destination is required"}), 400
         user_lat = _parse_optional_coord(body.get("user_lat"), "user_lat", -90, 90)
         user_lon = _parse_optional_coord(body.get("user_lon"), "user_lon", -180, 180)
-        coords = geocode(dest, user_lat=user_lat, user_lon=user_lon)
-        if not coords:
-            return jsonify({"error": f'Could not find "{dest}"'}), 404
-        if user_lat is None or user_lon is None:
-            return jsonify({"error": "user location required for routing"}), 400
-        raw = fetch_routes(user_lat, user_lon, coords["lat"], coords["lon"])
-        if not raw:
-            return jsonify({"error": "No routes found"}), 404
-        valid = [r for r in raw if r.get("geometry") and len(r["geometry"]) >= 2]
-        if not valid:
-            return jsonify({"error": "No valid route geometries"}), 404
-        normalised = []
-        for r in valid:
-            try:
-                normalised.append({
-                    "distance": float(r["distance"]),
-                    "duration": float(r["duration"]),
-                    "geometry": [[float(p[0]), float(p[1])] for p in r["geometry"]],
-                })
-            except (KeyError, TypeError, ValueError):
-                continue
-        log.info("route  '%s'  %.4f,%.4f  %d route(s)",
-                 dest, coords["lat"], coords["lon"], len(normalised))
-        return jsonify({"destination": coords, "routes": score_routes(normalised)})
+        key = ("route", dest.lower(), user_lat, user_lon)
+        payload, status = _inflight.do(key, _plan_route, dest, user_lat, user_lon)
+        if status != 200:
+            return jsonify(payload), status
+        return _routes_response(payload["routes"], payload["destination"])
 
     @application.post("/route-coords")
     @_rate_limit(30, 60)
     def route_coords():
-        body = request.get_json(silent=True) or {}
         try:
-            slat = _parse_coord(body.get("start_lat"), "start_lat", -90, 90)
-            slon = _parse_coord(body.get("start_lon"), "start_lon", -180, 180)
-            elat = _parse_coord(body.get("end_lat"),   "end_lat",   -90, 90)
-            elon = _parse_coord(body.get("end_lon"),   "end_lon",   -180, 180)
+            slat, slon, elat, elon = _parse_coord_fields(_json_body(), _ROUTE_COORDS_FIELDS)
         except ValueError as exc:
             return jsonify({"error": str(exc)}), 400
         raw = fetch_routes(slat, slon, elat, elon)
         if not raw:
             return jsonify({"error": "No routes found"}), 404
-        valid = [r for r in raw if r.get("geometry") and len(r["geometry"]) >= 2]
-        normalised = []
-        for r in valid:
-            try:
-                normalised.append({
-                    "distance": float(r["distance"]),
-                    "duration": float(r["duration"]),
-                    "geometry": [[float(p[0]), float(p[1])] for p in r["geometry"]],
-                })
-            except (KeyError, TypeError, ValueError):
-                continue
-        return jsonify({"routes": score_routes(normalised)})
+        return _routes_response(score_routes(raw))
 
     # ── Score routes (browser-collected OSRM routes, scored server-side) ────────
     @application.post("/score-routes")
@@ -716,7 +992,7 @@ def _register_routes(application: Flask) -> None:
                 continue
         if not normalised:
             return jsonify({"error": "No valid routes to score"}), 400
-        return jsonify({"routes": score_routes(normalised)})
+        return _routes_response(score_routes(normalised))
 
     # ── Suggestions + nearby ─────────────────────────────────────────────────
     @application.get("/suggestions")
@@ -727,7 +1003,11 @@ def _register_routes(application: Flask) -> None:
             return jsonify([])
         lat = _parse_optional_coord(request.args.get("lat"), "lat", -90, 90)
         lon = _parse_optional_coord(request.args.get("lon"), "lon", -180, 180)
-        return jsonify(get_suggestions(q, lat=lat, lon=lon, limit=_SUGGESTION_LIMIT))
+        key = ("sugg", q.lower(),
+               None if lat is None else round(lat, 1),
+               None if lon is None else round(lon, 1))
+        return jsonify(_inflight.do(key, get_suggestions, q,
+                                    lat=lat, lon=lon, limit=_SUGGESTION_LIMIT))
 
     @application.get("/nearby")
     @_rate_limit(20, 60)
@@ -821,7 +1101,7 @@ def _register_routes(application: Flask) -> None:
     @application.post("/admin/login")
     @_rate_limit(10, 60)
     def admin_login():
-        ip    = (request.headers.get("X-Forwarded-For", request.remote_addr) or "127.0.0.1").split(",")[0].strip()
+        ip    = _client_ip()
         body  = request.get_json(silent=True) or {}
         email = _sanitize_text(body.get("email",    ""), 120)
         pw    = _sanitize_text(body.get("password", ""), 120)
@@ -988,33 +1268,47 @@ def _register_routes(application: Flask) -> None:
 # ===========================================================================
 # Bootstrap
 # ===========================================================================
+
+def _resolve_ssl():
+    """
+    Decide once, at import, whether to serve HTTPS locally.
+
+    SSL is opt-in via SMARTNAV_SSL=1 (needed for GPS on some browsers) and
+    never used on Render, which terminates TLS itself.  By default the server
+    runs on plain HTTP so http://127.0.0.1:5000 works.  Returns
+    ``(cert_path, key_path)`` or ``None``.
+    """
+    if os.environ.get("SMARTNAV_SSL", "").strip() not in ("1", "true", "yes"):
+        return None
+    if os.environ.get(_RENDER_ENV_VAR):
+        return None
+    if not (_CERT_PATH.is_file() and _KEY_PATH.is_file()):
+        log.warning("ssl  SMARTNAV_SSL set but %s / %s missing — serving plain HTTP",
+                    _CERT_PATH, _KEY_PATH)
+        return None
+    log.info("ssl  cert=%s", _CERT_PATH)
+    return str(_CERT_PATH), str(_KEY_PATH)
+
+
+_SSL_CONTEXT = _resolve_ssl()
 _init_db()
 app = create_app()
 
 if __name__ == "__main__":
     is_render = bool(os.environ.get(_RENDER_ENV_VAR))
+    port      = int(os.environ.get("PORT", _DEFAULT_PORT))
+    proto     = "https" if _SSL_CONTEXT else "http"
 
-    # SSL is opt-in via environment variable SMARTNAV_SSL=1
-    # By default the server runs on plain HTTP so http://127.0.0.1:5000 works.
-    # To enable HTTPS locally (needed for GPS on some browsers):
-    #   SMARTNAV_SSL=1 python3 app.py
-    _want_ssl = os.environ.get("SMARTNAV_SSL", "").strip() in ("1", "true", "yes")
-    use_ssl   = (_want_ssl and not is_render
-                 and os.path.exists(_CERT_PATH)
-                 and os.path.exists(_KEY_PATH))
-
-    port = int(os.environ.get("PORT", _DEFAULT_PORT))
+    # Local development server.  Production runs gunicorn with gevent workers
+    # (Procfile / render.yaml → gunicorn -c gunicorn.conf.py app:app).
     kwargs = {
         "host":  "0.0.0.0",
         "port":  port,
         "debug": not is_render,
     }
-    if use_ssl:
-        kwargs["ssl_context"] = (_CERT_PATH, _KEY_PATH)
+    if _SSL_CONTEXT:
+        kwargs["ssl_context"] = _SSL_CONTEXT
 
-    proto = "https" if use_ssl else "http"
     log.info("SmartNav AI starting  proto=%s  port=%d  render=%s", proto, port, is_render)
     log.info("Open in browser: %s://127.0.0.1:%d", proto, port)
     app.run(**kwargs)
-
-
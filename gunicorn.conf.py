@@ -0,0 +1,38 @@
+"""
+gunicorn.conf.py — SmartNav AI production server settings
+==========================================================
+Start with:  gunicorn -c gunicorn.conf.py app:app
+
+The hot path (/route, /nearby, /suggestions) is almost entirely I/O-bound on
+Nominatim / OSRM / Overpass HTTP calls, so we run gevent workers: every
+blocking socket read yields to the hub and hundreds of in-flight upstream
+calls multiplex on greenlets inside one worker.
+
+gunicorn's gevent worker calls ``gevent.monkey.patch_all()`` before it
+imports ``app``, so ``requests`` (used by routing_engine) and the stdlib
+``threading`` / ``ThreadPoolExecutor`` helpers become cooperative without
+any changes to the application code.  Do NOT enable ``preload_app`` — that
+would import ``app`` in the master before patching.
+
+Every setting can be overridden through the environment.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+worker_class       = os.environ.get("GUNICORN_WORKER_CLASS", "gevent")
+workers            = int(os.environ.get("WEB_CONCURRENCY",
+                                        multiprocessing.cpu_count() * 2 + 1))
+# Exported so each worker's upstream egress throttles (routing_engine) take
+# an equal share of the per-host limits instead of each claiming all of it
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 65))   # > typical proxy idle timeout
+timeout   = int(os.environ.get("GUNICORN_TIMEOUT",   30))
+
+accesslog = "-"
+errorlog  = "-"
+loglevel  = os.environ.get("GUNICORN_LOG_LEVEL", "info")
@@ -18,24 +18,37 @@ Route fetching strategy:
   LONG   (>80 km)  : up to 4 via-waypoints, up to 3 unique routes
 
 Autocomplete suggestions:
-  - Nominatim structured search with India viewbox
+  - In-process place-name prefix index (seeded with major cities, learns
+    place results from Nominatim)
+  - Nominatim structured search with India viewbox when the index is short
 
 NOTE: Nominatim policy requires max 1 request/second and a valid User-Agent.
 """
 
+import atexit
+import heapq
 import logging
 import math
+import os
 import re
 import time
+from bisect import bisect_left, bisect_right, insort
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from threading import BoundedSemaphore, Lock
 from typing import Optional
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:                                # optional — Rust JSON decoder, stdlib otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Logging  (callers configure handlers; we just emit records)
 # ---------------------------------------------------------------------------
@@ -61,18 +74,44 @@ SNAP_MAX_DIST_M        = 300      # discard road-snap if snapped point is farthe
 POI_SUPPLEMENT_MIN     = 5        # supplement Overpass with Nominatim if below this
 POI_MAX_RESULTS        = 20       # cap on returned POI results
 NOMINATIM_NEARBY_LIMIT = 12       # max results from Nominatim nearby fallback
-
-TIMEOUT    = 18   # seconds — Nominatim / Overpass / Photon
-TIMEOUT_OV = 22   # seconds — Overpass can be slow
+_NEARBY_CELL_FRACTION  = 0.1      # nearby cache cell side, as a fraction of the radius
+_NEARBY_CELL_MAX_DEG   = 0.01     # … but never wider than ~1.1 km
+
+NOMINATIM_MIN_INTERVAL_S = 1.0   # Nominatim usage policy: max 1 request/second
+NOMINATIM_MAX_QUEUE_S    = 3.0   # refuse (→ fallback) rather than queue longer
+SUGGEST_MAX_QUEUE_S      = 0.5   # autocomplete: a keystroke this stale is superseded
+OVERPASS_MAX_CONCURRENT  = 2     # public Overpass grants ~2 query slots per client IP
+OVERPASS_MAX_QUEUE_S     = 5.0
+PHOTON_MAX_CONCURRENT    = 2
+PHOTON_MAX_QUEUE_S       = 3.0
+
+# Server processes sharing this host's egress IP (gunicorn.conf.py exports its
+# worker count; 1 under the dev server).  The per-IP limits above are split
+# evenly between them — Overpass keeps at least one slot per worker.
+_EGRESS_WORKERS = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+
+# (connect, read) pairs: an unreachable host fails in seconds so the next
+# fallback still runs, while a slow-but-alive host keeps its full read budget
+CONNECT_TIMEOUT = 3.05                   # seconds — TCP + TLS setup
+TIMEOUT    = (CONNECT_TIMEOUT, 15)       # Nominatim / Photon
+TIMEOUT_OV = (CONNECT_TIMEOUT, 22)       # Overpass can be slow to answer
 
 # OSRM-specific timeouts (separate from geocoding — different failure mode)
-_SNAP_TIMEOUT        = 2     # seconds — snap is "nice to have"; fail fast, use original
-_OSRM_TIMEOUT        = 5     # seconds — per individual routing call
-_OSRM_FALLBACK_TIMEOUT = 8   # seconds — one relaxed direct retry before giving up
+_OSRM_CONNECT_TIMEOUT = 2    # seconds — connect phase of every OSRM call
+_SNAP_TIMEOUT        = 2     # seconds (read) — snap is "nice to have"; fail fast, use original
+_OSRM_TIMEOUT        = 5     # seconds (read) — per individual routing call
+_OSRM_FALLBACK_TIMEOUT = 8   # seconds (read) — one relaxed direct retry before giving up
 _OSRM_WORKERS        = 4     # max parallel OSRM threads (>4 triggers 429 on public instance)
 _OSRM_SUBMIT_DELAY   = 0.05  # seconds between task submissions to avoid request burst
 _OSRM_TOTAL_BUDGET   = 12.0  # seconds — total wall-clock budget for one fetch_routes() call
 
+# Connection-pool sizing.  urllib3 keeps one pool per host; with gevent
+# workers many greenlets share a session, so the per-host pool must be large
+# enough that concurrent requests reuse warm TCP+TLS connections instead of
+# opening (and then discarding) overflow sockets.
+_HTTP_POOL_HOSTS   = 4    # nominatim, overpass, photon, ip-api headroom
+_HTTP_POOL_MAXSIZE = 32   # keep-alive sockets retained per host
+
 # India bounding box (lat_min, lat_max, lon_min, lon_max)
 INDIA_BBOX    = "6.5,68.0,37.5,97.5"   # Nominatim viewbox format
 INDIA_LAT_MIN = 6.5
@@ -93,9 +132,24 @@ _NEAR_PHRASES: frozenset[str] = frozenset({
     "around me", "close by", "closest", "nearest",
 })
 
+# Every near-me phrase (plus surrounding blanks) in one alternation, longest
+# first, so stripping them is a single regex pass over lower-cased text
+_NEAR_RE = re.compile(
+    r"\s*(?:"
+    + "|".join(re.escape(p) for p in sorted(_NEAR_PHRASES, key=lambda p: (-len(p), p)))
+    + r")\s*"
+)
+
+# Any run of characters outside [0-9a-z] collapses to one space
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
 # HTTP headers required by all upstream APIs
 _HEADERS = {
-    "User-Agent": "SmartNavAI/5.0 (India navigation; academic; contact: student@edu.in)"
+    "User-Agent": "SmartNavAI/5.0 (India navigation; academic; contact: student@edu.in)",
+    "Connection": "keep-alive",
+    # No Accept-Encoding here: requests already sends urllib3's default,
+    # which advertises every codec it can decode ("br" once brotli is
+    # installed), so Overpass JSON arrives compressed.
 }
 
 # ---------------------------------------------------------------------------
@@ -105,8 +159,9 @@ _HEADERS = {
 def _make_session() -> requests.Session:
     """
     Build a requests.Session with:
-    - shared User-Agent header
+    - shared User-Agent / keep-alive headers
     - automatic retry (2 attempts) on 429 / 5xx with exponential back-off
+    - a connection pool sized for many concurrent greenlets per host
     """
     session = requests.Session()
     retry = Retry(
@@ -116,7 +171,11 @@ def _make_session() -> requests.Session:
         allowed_methods={"GET", "POST"},
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_HOSTS,
+        pool_maxsize=_HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
     session.mount("https://", adapter)
     session.mount("http://",  adapter)
     session.headers.update(_HEADERS)
@@ -131,10 +190,124 @@ _session = _make_session()
 # succeed.  Connection pooling is still active via the shared adapter.
 _osrm_session = requests.Session()
 _osrm_session.headers.update(_HEADERS)
-_osrm_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=_OSRM_WORKERS * 2)
+_osrm_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=_HTTP_POOL_MAXSIZE)
 _osrm_session.mount("https://", _osrm_adapter)
 _osrm_session.mount("http://",  _osrm_adapter)
 
+
+# Background workers for calls to one host that overlap calls to another
+# (Photon alongside the Nominatim geocode chain).  Threads, not asyncio:
+# under gunicorn's gevent worker they are already cooperative greenlets.
+_UPSTREAM_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="snav-upstream")
+
+
+@atexit.register
+def _close_sessions() -> None:
+    """Release pooled keep-alive sockets when the worker exits."""
+    _session.close()
+    _osrm_session.close()
+
+
+def _json(r: requests.Response):
+    """Decode a JSON response body — orjson when installed, else ``r.json()``."""
+    body = r.content
+    if body == b"[]":               # Nominatim "no match" — the common miss
+        return []
+    if orjson is not None:
+        return orjson.loads(body)
+    return r.json()
+
+
+# ---------------------------------------------------------------------------
+# Upstream egress throttles  (Nominatim fair-use: ≤ 1 request / second;
+# Overpass and Photon: bounded requests in flight)
+# ---------------------------------------------------------------------------
+
+
+class _UpstreamBusy(RuntimeError):
+    """Raised instead of queueing a call past the throttle's wait budget."""
+
+
+class _Throttle:
+    """
+    Per-host egress gate: a minimum interval between call starts (a one-slot
+    token bucket) and, optionally, a cap on calls in flight.  Each caller
+    reserves the next free start slot and sleeps until it; if that slot — or
+    a free concurrency slot — is more than *max_wait_s* away the call is
+    refused with ``_UpstreamBusy`` so the caller's normal fallback path runs
+    instead of the request queueing behind a burst.
+
+    State is per process, so the module-level throttles below are built with
+    this worker's share of each host limit (``_EGRESS_WORKERS``).
+    """
+
+    def __init__(self, min_interval_s: float, max_wait_s: float,
+                 max_concurrent: Optional[int] = None) -> None:
+        self.min_interval_s = min_interval_s
+        self.max_wait_s = max_wait_s
+        self._next = 0.0
+        self._lock = Lock()
+        self._slots = BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def wait(self, max_wait_s: Optional[float] = None) -> None:
+        limit = self.max_wait_s if max_wait_s is None else max_wait_s
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            if slot - now > limit:
+                raise _UpstreamBusy(f"throttle queue exceeds {limit:.1f}s")
+            self._next = slot + self.min_interval_s
+        if slot > now:
+            time.sleep(slot - now)
+
+    @contextmanager
+    def slot(self, max_wait_s: Optional[float] = None):
+        """Hold a concurrency slot (if capped) for the body, after the interval wait."""
+        limit = self.max_wait_s if max_wait_s is None else max_wait_s
+        if self._slots is None:
+            self.wait(limit)
+            yield
+            return
+        if not self._slots.acquire(timeout=limit):
+            raise _UpstreamBusy(f"no free upstream slot within {limit:.1f}s")
+        try:
+            self.wait(limit)
+            yield
+        finally:
+            self._slots.release()
+
+
+_NOMINATIM_THROTTLE = _Throttle(NOMINATIM_MIN_INTERVAL_S * _EGRESS_WORKERS,
+                                NOMINATIM_MAX_QUEUE_S)
+_OVERPASS_THROTTLE  = _Throttle(0.0, OVERPASS_MAX_QUEUE_S,
+                                max(1, OVERPASS_MAX_CONCURRENT // _EGRESS_WORKERS))
+_PHOTON_THROTTLE    = _Throttle(0.0, PHOTON_MAX_QUEUE_S, PHOTON_MAX_CONCURRENT)
+
+
+def _nominatim_get(url: str, max_wait_s: Optional[float] = None,
+                   **kwargs) -> requests.Response:
+    """
+    ``_session.get`` for Nominatim endpoints, spaced by the egress throttle.
+
+    *max_wait_s* tightens the queueing limit for callers whose answer goes
+    stale quickly.
+    """
+    with _NOMINATIM_THROTTLE.slot(max_wait_s):
+        return _session.get(url, **kwargs)
+
+
+def _photon_get(url: str, **kwargs) -> requests.Response:
+    """``_session.get`` for Photon, capped at ``PHOTON_MAX_CONCURRENT`` in flight."""
+    with _PHOTON_THROTTLE.slot():
+        return _session.get(url, **kwargs)
+
+
+def _overpass_post(url: str, **kwargs) -> requests.Response:
+    """``_session.post`` for Overpass, capped at ``OVERPASS_MAX_CONCURRENT`` in flight."""
+    with _OVERPASS_THROTTLE.slot():
+        return _session.post(url, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Lightweight TTL caches (reduce upstream API churn)
 # ---------------------------------------------------------------------------
@@ -198,10 +371,12 @@ def _round_coord(value: Optional[float], places: int = 4) -> Optional[float]:
         return None
 
 
-_GEOCODE_CACHE = _TTLCache(maxsize=512, ttl_s=60 * 60)   # 1 hour
-_SUGGEST_CACHE = _TTLCache(maxsize=512, ttl_s=10 * 60)  # 10 minutes
-_NEARBY_CACHE  = _TTLCache(maxsize=256, ttl_s=5 * 60)   # 5 minutes
+_GEOCODE_CACHE = _TTLCache(maxsize=4096, ttl_s=60 * 60)  # 1 hour
+_SUGGEST_CACHE = _TTLCache(maxsize=4096, ttl_s=10 * 60) # 10 minutes, ~11 km bias cells
+_NEARBY_CACHE  = _TTLCache(maxsize=2048, ttl_s=10 * 60) # 10 minutes, radius-sized grid cells
 _ROUTE_CACHE   = _TTLCache(maxsize=128, ttl_s=2 * 60)   # 2 minutes
+_SNAP_CACHE    = _TTLCache(maxsize=4096, ttl_s=24 * 60 * 60)  # 24 hours, ~11 m cells
+_CITY_CACHE    = _TTLCache(maxsize=2048, ttl_s=24 * 60 * 60)  # 24 hours, ~1.1 km cells
 
 
 # ---------------------------------------------------------------------------
@@ -355,6 +530,28 @@ POI_TAG_MAP: dict[str, list[tuple[str, str]]] = {
     "courier":       [("amenity", "post_office"), ("office", "courier")],
 }
 
+# Freeze the tag lists: immutable, hashable values can be shared by the
+# memoised helpers below and passed straight to _build_overpass_query.
+POI_TAG_MAP: dict[str, tuple[tuple[str, str], ...]] = {
+    key: tuple(tags) for key, tags in POI_TAG_MAP.items()
+}
+
+# POI keywords in sorted order — completions of a prefix are one contiguous,
+# bisect-located run; _POI_KEY_RANK restores POI_TAG_MAP's preference order
+_POI_KEYS_SORTED: tuple[str, ...] = tuple(sorted(POI_TAG_MAP))
+_POI_KEY_RANK: dict[str, int] = {key: i for i, key in enumerate(POI_TAG_MAP)}
+
+
+def _poi_keys_with_prefix(prefix: str) -> list[str]:
+    """``POI_TAG_MAP`` keys starting with *prefix*, in map order."""
+    keys = _POI_KEYS_SORTED
+    i = bisect_left(keys, prefix)
+    j = i
+    while j < len(keys) and keys[j].startswith(prefix):
+        j += 1
+    return sorted(keys[i:j], key=_POI_KEY_RANK.__getitem__)
+
+
 _GEOCODE_PLACE_TYPES: frozenset[str] = frozenset({
     "city", "town", "village", "hamlet", "suburb", "quarter", "neighbourhood",
     "neighborhood", "county", "state", "state_district", "district",
@@ -376,15 +573,43 @@ def _clamp(val: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, val))
 
 
+_DEG2RAD          = math.pi / 180.0
+_EARTH_DIAMETER_M = 2.0 * 6_371_000.0
+_M_PER_DEG_LAT    = _EARTH_DIAMETER_M * 0.5 * _DEG2RAD   # ≈ 111.2 km
+
+
 def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Return great-circle distance in metres between two WGS-84 points."""
-    R = 6_371_000.0
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi    = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = (math.sin(dphi / 2) ** 2
-         + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2)
-    return R * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+    # Constant multiplies and local squares instead of math.radians()/** —
+    # this runs once per candidate on the geocode and snap paths.
+    s_dphi = math.sin((lat2 - lat1) * (_DEG2RAD * 0.5))
+    s_dlam = math.sin((lon2 - lon1) * (_DEG2RAD * 0.5))
+    a = (s_dphi * s_dphi
+         + math.cos(lat1 * _DEG2RAD) * math.cos(lat2 * _DEG2RAD) * s_dlam * s_dlam)
+    return _EARTH_DIAMETER_M * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+
+
+def _haversine_from(lat0: float, lon0: float, points) -> list[float]:
+    """
+    Great-circle distances in metres from (*lat0*, *lon0*) to each
+    ``(lat, lon)`` in *points*.
+
+    Bulk form of ``_haversine``: the origin's radians and cosine are
+    computed once instead of once per point.
+    """
+    rad = _DEG2RAD
+    sin, cos, sqrt, atan2 = math.sin, math.cos, math.sqrt, math.atan2
+    phi0 = lat0 * rad
+    cos_phi0 = cos(phi0)
+    lam0 = lon0 * rad
+    out = []
+    for lat, lon in points:
+        phi = lat * rad
+        s_dphi = sin((phi - phi0) * 0.5)
+        s_dlam = sin((lon * rad - lam0) * 0.5)
+        a = s_dphi * s_dphi + cos_phi0 * cos(phi) * s_dlam * s_dlam
+        out.append(_EARTH_DIAMETER_M * atan2(sqrt(a), sqrt(1.0 - a)))
+    return out
 
 
 def _in_india(lat: float, lon: float) -> bool:
@@ -393,6 +618,17 @@ def _in_india(lat: float, lon: float) -> bool:
             INDIA_LON_MIN <= lon <= INDIA_LON_MAX)
 
 
+def _snap_from_cache(lat: float, lon: float) -> Optional[tuple[float, float]]:
+    """
+    Return the cached ``_snap_to_road`` answer for (*lat*, *lon*), or
+    ``None`` when its ~11 m cell has not been snapped recently.
+    """
+    hit, cached = _cache_get(_SNAP_CACHE, (_round_coord(lat, 4), _round_coord(lon, 4)))
+    if not hit:
+        return None
+    return cached if cached is not None else (lat, lon)
+
+
 def _snap_to_road(lat: float, lon: float) -> tuple[float, float]:
     """
     Snap a GPS coordinate to the nearest drivable road node via OSRM /nearest.
@@ -402,23 +638,32 @@ def _snap_to_road(lat: float, lon: float) -> tuple[float, float]:
     critical for GPS fixes that land inside buildings, water bodies, or fields
     where OSRM cannot start/end a route.
 
-    Uses ``_SNAP_TIMEOUT`` (3 s) with **no retries** — the snap is a best-effort
+    Uses ``_SNAP_TIMEOUT`` (2 s read) with **no retries** — the snap is a best-effort
     improvement; if OSRM is slow we keep the original coordinate immediately
     rather than stalling the whole request.
+
+    Answers are cached per ~11 m cell (4 dp).  A "keep original" answer is
+    cached too; a failed call is not, so a transient OSRM error is retried.
     """
+    cached = _snap_from_cache(lat, lon)
+    if cached is not None:
+        return cached
+    cache_key = (_round_coord(lat, 4), _round_coord(lon, 4))
     try:
         url = f"{OSRM_NEAREST}/{lon},{lat}"
-        r = _osrm_session.get(url, params={"number": 1}, timeout=_SNAP_TIMEOUT)
+        r = _osrm_session.get(url, params={"number": 1},
+                              timeout=(_OSRM_CONNECT_TIMEOUT, _SNAP_TIMEOUT))
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         if data.get("code") == "Ok" and data.get("waypoints"):
             snapped_lon, snapped_lat = data["waypoints"][0]["location"]
             dist = _haversine(lat, lon, snapped_lat, snapped_lon)
             if dist <= SNAP_MAX_DIST_M:
                 log.debug("snap  (%f,%f) → (%f,%f)  dist=%.0fm",
                           lat, lon, snapped_lat, snapped_lon, dist)
-                return snapped_lat, snapped_lon
+                return _cache_return(_SNAP_CACHE, cache_key, (snapped_lat, snapped_lon))
             log.debug("snap  snapped point %.0fm away — keeping original", dist)
+        _cache_set(_SNAP_CACHE, cache_key, None)
     except Exception as exc:
         log.warning("snap  OSRM nearest failed: %s", exc)
     return lat, lon
@@ -433,11 +678,16 @@ def get_city_name(lat: float, lon: float) -> Optional[str]:
     Reverse-geocode to retrieve the city/town name for a coordinate.
     Used to bias forward geocoding results to the user's own city.
 
-    Results are **not** cached here because the user's location can change
-    across sessions; callers that need caching should wrap this themselves.
+    Answers are cached for 24 h per ~1.1 km cell (2 dp) — far finer than a
+    city boundary, so a moving user still gets the right name.  Failed
+    calls are not cached.
     """
+    cache_key = (_round_coord(lat, 2), _round_coord(lon, 2))
+    hit, cached = _cache_get(_CITY_CACHE, cache_key)
+    if hit:
+        return cached
     try:
-        r = _session.get(
+        r = _nominatim_get(
             NOMINATIM_REVERSE,
             params={
                 "lat":          lat,
@@ -446,16 +696,16 @@ def get_city_name(lat: float, lon: float) -> Optional[str]:
                 "zoom":         10,   # city-level granularity
                 "addressdetails": 1,
             },
-            timeout=8,
+            timeout=(CONNECT_TIMEOUT, 8),
         )
         r.raise_for_status()
-        addr = r.json().get("address", {})
+        addr = _json(r).get("address", {})
         city = (addr.get("city") or addr.get("town") or
                 addr.get("village") or addr.get("county") or
                 addr.get("state_district"))
         if city:
             log.debug("city  detected: %s", city)
-        return city
+        return _cache_return(_CITY_CACHE, cache_key, city)
     except Exception as exc:
         log.warning("city  reverse geocode failed: %s", exc)
         return None
@@ -465,20 +715,21 @@ def get_city_name(lat: float, lon: float) -> Optional[str]:
 # POI helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1024)
 def _extract_poi_keyword(query: str) -> Optional[str]:
     """
     Detect whether *query* is a POI/nearby search such as ``'mobile shop near me'``.
 
     Returns the cleaned keyword (e.g. ``'mobile shop'``) on a match, or
     ``None`` if the query looks like an ordinary place name.
+
+    Pure function of *query* (``POI_TAG_MAP`` is static), so results are
+    memoised — ``/nearby`` and ``/suggestions`` see the same phrases repeatedly.
     """
-    q = query.lower().strip()
-    if not any(phrase in q for phrase in _NEAR_PHRASES):
+    # Strip all near-me variants to isolate the keyword; none found → not POI
+    q, n_near = _NEAR_RE.subn(" ", query.lower())
+    if not n_near:
         return None
-
-    # Strip all near-me variants to isolate the keyword
-    for phrase in _NEAR_PHRASES:
-        q = q.replace(phrase, "")
     q = q.strip().rstrip(",").strip()
 
     if not q:
@@ -499,8 +750,23 @@ def _normalize_search_text(value: str) -> str:
     """
     Lower-case and collapse a free-form place string to comparable ASCII words.
     """
-    cleaned = re.sub(r"[^0-9a-z]+", " ", value.lower())
-    return re.sub(r"\s+", " ", cleaned).strip()
+    return _NON_ALNUM_RE.sub(" ", value.lower()).strip()
+
+
+def _split_display_name(display: str) -> tuple[str, str]:
+    """
+    ``("Connaught Place", "New Delhi, Delhi, India")`` from a Nominatim
+    ``display_name`` — the first segment, then up to three more.
+
+    Walks the string with ``partition`` so the (often long) remainder is
+    never split into a full list.
+    """
+    head, sep, tail = display.partition(",")
+    parts: list[str] = []
+    while sep and len(parts) < 3:
+        part, sep, tail = tail.partition(",")
+        parts.append(part.strip())
+    return head.strip(), ", ".join(parts)
 
 
 def _primary_geocode_label(item: dict) -> str:
@@ -510,7 +776,7 @@ def _primary_geocode_label(item: dict) -> str:
     display_name = str(item.get("display_name", "")).strip()
     if not display_name:
         return ""
-    return display_name.split(",")[0].strip()
+    return display_name.partition(",")[0].strip()
 
 
 def _looks_generic_destination(query: str) -> bool:
@@ -658,39 +924,174 @@ def _choose_best_geocode_candidate(query: str,
     return best_item
 
 
-def _build_overpass_query(tags: list[tuple[str, str]],
-                          lat: float, lon: float,
-                          radius_m: int) -> str:
+@lru_cache(maxsize=512)
+def _overpass_template(tags: tuple[tuple[str, str], ...]) -> str:
     """
-    Build an Overpass QL query that finds nodes/ways/relations matching *tags*
-    within *radius_m* metres of (*lat*, *lon*).
+    Overpass QL skeleton for *tags* with ``{r}``, ``{lat}``, ``{lon}`` and
+    ``{limit}`` placeholders — the tag-dependent work, done once per tag set.
 
     ``religion`` tags are skipped as standalone predicates — they only make
     sense as filters within a combined ``place_of_worship`` query and would
     return no results alone.
     """
     parts: list[str] = []
-    for tag_key, tag_val in tags:
-        if tag_key == "religion":
+    # dict.fromkeys: ordered de-duplication, so a (key, value) pair listed
+    # twice — or shared by several unioned keywords — is emitted once.  A
+    # ["key"] wildcard clause already covers every ["key"="value"] clause.
+    unique = dict.fromkeys(tags)
+    wildcards = {tag_key for tag_key, tag_val in unique if tag_val == "*"}
+    for tag_key, tag_val in unique:
+        if tag_key == "religion" or (tag_val != "*" and tag_key in wildcards):
             continue
         for element in ("node", "way", "relation"):
             if tag_val == "*":
-                parts.append(
-                    f'{element}["{tag_key}"](around:{radius_m},{lat},{lon});'
-                )
+                parts.append(f'{element}["{tag_key}"](around:{{r}},{{lat}},{{lon}});')
             else:
                 parts.append(
                     f'{element}["{tag_key}"="{tag_val}"]'
-                    f"(around:{radius_m},{lat},{lon});"
+                    f"(around:{{r}},{{lat}},{{lon}});"
                 )
     union = "\n  ".join(parts)
-    return f"[out:json][timeout:25];\n(\n  {union}\n);\nout center tags 30;"
+    return f"[out:json][timeout:25];\n(\n  {union}\n);\nout center tags {{limit}};"
+
+
+# Every POI keyword's skeleton is built at import; unioned multi-keyword
+# tag sets are built on first use and then served from the same cache.
+for _tags in POI_TAG_MAP.values():
+    _overpass_template(_tags)
+
+
+def _build_overpass_query(tags: tuple[tuple[str, str], ...],
+                          lat: float, lon: float,
+                          radius_m: int,
+                          limit: int = 30) -> str:
+    """
+    Build an Overpass QL query that finds nodes/ways/relations matching *tags*
+    within *radius_m* metres of (*lat*, *lon*).
+
+    Fills the precompiled ``_overpass_template`` in one ``format_map`` call;
+    the per-tag-set work is memoised there.  The query itself is not — it
+    only runs on a ``_NEARBY_CACHE`` miss, so the same string rarely recurs.
+    """
+    return _overpass_template(tags).format_map(
+        {"r": radius_m, "lat": lat, "lon": lon, "limit": limit})
 
 
 # ---------------------------------------------------------------------------
 # POI / Nearby search
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1024)
+def _resolve_poi_tags(kw: str) -> Optional[tuple[tuple[str, str], ...]]:
+    """OSM tags for a lower-cased POI keyword — exact ``POI_TAG_MAP`` key, then partial."""
+    tags = POI_TAG_MAP.get(kw)
+    if not tags:
+        for key, val in POI_TAG_MAP.items():
+            if key in kw or kw in key:
+                return val
+    return tags
+
+
+def _overpass_point(el: dict) -> Optional[tuple[str, float, float]]:
+    """``(name, lat, lon)`` of one Overpass element, or ``None`` if it has no name/position."""
+    el_tags = el.get("tags", {})
+
+    name = next(
+        (el_tags.get(f) for f in _POI_NAME_FIELDS if el_tags.get(f)),
+        None,
+    )
+    if not name:
+        return None
+
+    # Coordinates — nodes have lat/lon directly; ways/relations use center
+    if el["type"] == "node":
+        elat, elon = el.get("lat"), el.get("lon")
+    elif el["type"] in ("way", "relation") and "center" in el:
+        elat = el["center"]["lat"]
+        elon = el["center"]["lon"]
+    else:
+        return None
+
+    if elat is None or elon is None:
+        return None
+    return name, elat, elon
+
+
+def _overpass_poi(el: dict, point: tuple[str, float, float], dist: float,
+                  fallback_type: str) -> dict:
+    """Convert one Overpass element, its ``_overpass_point`` and distance, to a POI dict."""
+    el_tags = el.get("tags", {})
+    name, elat, elon = point
+
+    addr_parts = [
+        el_tags[f]
+        for f in ("addr:housenumber", "addr:street",
+                  "addr:suburb", "addr:city", "addr:state")
+        if el_tags.get(f)
+    ]
+    address = ", ".join(addr_parts) or None
+
+    poi_type = next(
+        (el_tags.get(k)
+         for k in ("amenity", "shop", "tourism", "leisure",
+                   "highway", "railway", "office")
+         if el_tags.get(k)),
+        fallback_type,
+    )
+
+    extra = {
+        field: el_tags[field][:120]
+        for field in _POI_EXTRA_FIELDS
+        if el_tags.get(field)
+    }
+
+    return {
+        "name":       name.strip(),
+        "lat":        round(float(elat), 6),
+        "lon":        round(float(elon), 6),
+        "type":       poi_type,
+        "address":    address,
+        "distance_m": round(dist),
+        "extra":      extra or None,
+    }
+
+
+def _overpass_elements(query: str) -> list[dict]:
+    """POST *query* to Overpass and return its ``elements`` list."""
+    r = _overpass_post(
+        OVERPASS_BASE,
+        data={"data": query},
+        timeout=TIMEOUT_OV,
+    )
+    r.raise_for_status()
+    return _json(r).get("elements", [])
+
+
+def _supplement(results: list[dict], keyword: str,
+                lat: float, lon: float,
+                radius_m: int) -> tuple[list[dict], bool]:
+    """
+    Sort *results* and top them up from Nominatim when thin.
+
+    Returns ``(results, complete)``; *complete* is ``False`` when the
+    Nominatim top-up was refused as busy, so the list may be short.
+    """
+    results.sort(key=lambda x: x["distance_m"])
+    if len(results) < POI_SUPPLEMENT_MIN:
+        try:
+            nom_results = _nominatim_nearby(keyword, lat, lon, radius_m)
+        except _UpstreamBusy as exc:
+            log.warning("search_nearby  Nominatim supplement for '%s' refused: %s", keyword, exc)
+            return results, False
+        existing_names = {r["name"].lower() for r in results}
+        for item in nom_results:
+            if item["name"].lower() not in existing_names:
+                results.append(item)
+                existing_names.add(item["name"].lower())
+        results.sort(key=lambda x: x["distance_m"])
+    return results, True
+
+
 def search_nearby(keyword: str, lat: float, lon: float,
                   radius_m: int = 5000) -> list[dict]:
     """
@@ -708,131 +1109,166 @@ def search_nearby(keyword: str, lat: float, lon: float,
     """
     if not keyword or not keyword.strip():
         return []
+    return search_nearby_multi([keyword], lat, lon, radius_m)[keyword]
 
-    cache_key = (
-        keyword.strip().lower(),
-        _round_coord(lat, 4),
-        _round_coord(lon, 4),
-        int(radius_m),
-    )
-    hit, cached = _cache_get(_NEARBY_CACHE, cache_key)
-    if hit:
-        return cached or []
-
-    kw = keyword.lower().strip()
-    tags = POI_TAG_MAP.get(kw)
 
-    # Partial keyword match
-    if not tags:
-        for key, val in POI_TAG_MAP.items():
-            if key in kw or kw in key:
-                tags = val
-                break
-
-    if not tags:
-        result = _nominatim_nearby(keyword, lat, lon, radius_m)
-        _cache_set(_NEARBY_CACHE, cache_key, result)
-        return result
-
-    query = _build_overpass_query(tags, lat, lon, radius_m)
-
-    try:
-        r = _session.post(
-            OVERPASS_BASE,
-            data={"data": query},
-            timeout=TIMEOUT_OV,
-        )
-        r.raise_for_status()
-        elements = r.json().get("elements", [])
-
-        results: list[dict] = []
-        seen: set[str] = set()
-
-        for el in elements:
-            el_tags = el.get("tags", {})
-
-            name = next(
-                (el_tags.get(f) for f in _POI_NAME_FIELDS if el_tags.get(f)),
-                None,
-            )
-            if not name:
-                continue
-
-            name = name.strip()
-            name_key = name.lower()
-            if name_key in seen:
-                continue
-            seen.add(name_key)
-
-            # Coordinates — nodes have lat/lon directly; ways/relations use center
-            if el["type"] == "node":
-                elat, elon = el.get("lat"), el.get("lon")
-            elif el["type"] in ("way", "relation") and "center" in el:
-                elat = el["center"]["lat"]
-                elon = el["center"]["lon"]
-            else:
-                continue
-
-            if elat is None or elon is None:
-                continue
+def search_nearby_multi(keywords: list[str], lat: float, lon: float,
+                        radius_m: int = 5000) -> dict[str, list[dict]]:
+    """
+    ``search_nearby`` for several keywords with a single Overpass round-trip.
 
-            dist = _haversine(lat, lon, elat, elon)
+    The OSM tags of every uncached keyword are unioned into one query; each
+    returned element is attributed back to the keyword(s) whose tags it
+    carries.  Per-keyword caching, Nominatim supplement and fallback behave
+    exactly as in ``search_nearby``.  Returns ``{keyword: [poi, ...]}``.
 
-            addr_parts = [
-                el_tags[f]
-                for f in ("addr:housenumber", "addr:street",
-                          "addr:suburb", "addr:city", "addr:state")
-                if el_tags.get(f)
-            ]
-            address = ", ".join(addr_parts) or None
-
-            poi_type = next(
-                (el_tags.get(k)
-                 for k in ("amenity", "shop", "tourism", "leisure",
-                           "highway", "railway", "office")
-                 if el_tags.get(k)),
-                keyword,
-            )
+    Upstreams are queried once per ``_nearby_cell`` — from the cell centre,
+    far enough to cover *radius_m* around any point in it — and the cached
+    cell answer is filtered and re-measured for each caller.
 
-            extra = {
-                field: el_tags[field][:120]
-                for field in _POI_EXTRA_FIELDS
-                if el_tags.get(field)
-            }
+    A keyword whose answer was cut short by an upstream gate refusing the
+    call (``_UpstreamBusy``) is returned as-is but not cached, so a burst
+    does not pin an empty or thin list on the whole grid cell.
+    """
+    out: dict[str, list[dict]] = {}
+    busy: set[str] = set()                            # answers not to cache
+    row, col, clat, clon, reach_m = _nearby_cell(lat, lon, radius_m)
 
-            results.append({
-                "name":       name,
-                "lat":        round(float(elat), 6),
-                "lon":        round(float(elon), 6),
-                "type":       poi_type,
-                "address":    address,
-                "distance_m": round(dist),
-                "extra":      extra or None,
-            })
+    def nominatim_only(keyword: str) -> list[dict]:
+        try:
+            return _nominatim_nearby(keyword, clat, clon, reach_m)
+        except _UpstreamBusy as exc:
+            log.warning("search_nearby  Nominatim for '%s' refused: %s", keyword, exc)
+            busy.add(keyword)
+            return []
 
-        results.sort(key=lambda x: x["distance_m"])
-        log.debug("search_nearby  Overpass found %d result(s) for '%s'",
-                  len(results), keyword)
+    pending: dict[str, tuple] = {}                    # keyword → cache key
+    tagged:  dict[str, tuple[tuple[str, str], ...]] = {}  # keyword → OSM tags
+    untagged: list[str] = []                          # Nominatim-only keywords
 
-        # Supplement with Nominatim if Overpass returned too few hits
-        if len(results) < POI_SUPPLEMENT_MIN:
-            nom_results = _nominatim_nearby(keyword, lat, lon, radius_m)
-            existing_names = {r["name"].lower() for r in results}
-            for item in nom_results:
-                if item["name"].lower() not in existing_names:
-                    results.append(item)
-                    existing_names.add(item["name"].lower())
-            results.sort(key=lambda x: x["distance_m"])
-
-        final = results[:POI_MAX_RESULTS]
-        _cache_set(_NEARBY_CACHE, cache_key, final)
-        return final
+    for keyword in keywords:
+        if keyword in out or keyword in pending:
+            continue
+        if not keyword or not keyword.strip():
+            out[keyword] = []
+            continue
+        # Keyed on the grid cell so every user in it shares one upstream
+        # answer; distances are re-measured from the caller on a hit.
+        cache_key = (keyword.strip().lower(), row, col, int(radius_m))
+        hit, cached = _cache_get(_NEARBY_CACHE, cache_key)
+        if hit:
+            out[keyword] = _relocate_pois(cached or [], lat, lon, radius_m)
+            continue
+        pending[keyword] = cache_key
+        tags = _resolve_poi_tags(keyword.lower().strip())
+        if tags:
+            tagged[keyword] = tags
+        else:
+            untagged.append(keyword)
+
+    for keyword in untagged:
+        out[keyword] = nominatim_only(keyword)
+
+    if tagged:
+        # (key, value) → keywords; "*" entries match any value of that key
+        owners: dict[tuple[str, str], list[str]] = {}
+        union_tags: list[tuple[str, str]] = []
+        for keyword, tags in tagged.items():
+            for tag in tags:
+                if tag not in owners:
+                    owners[tag] = []
+                    union_tags.append(tag)
+                owners[tag].append(keyword)
+        single = next(iter(tagged)) if len(tagged) == 1 else None
+
+        query = _build_overpass_query(tagged[single] if single is not None else tuple(union_tags),
+                                      round(clat, 6), round(clon, 6), reach_m,
+                                      limit=30 * len(tagged))
+        try:
+            elements = _overpass_elements(query)
+            # Drop unnamed / unplaced elements, then measure the rest in one pass
+            located = []
+            for el in elements:
+                point = _overpass_point(el)
+                if point is not None:
+                    located.append((el, point))
+            dists = _haversine_from(clat, clon, [(pt[1], pt[2]) for _, pt in located])
+
+            found: dict[str, list[dict]] = {kw: [] for kw in tagged}
+            seen:  dict[str, set[str]]   = {kw: set() for kw in tagged}
+            for (el, point), dist in zip(located, dists):
+                if single is not None:
+                    matches = (single,)
+                else:
+                    matches = {}
+                    for tag_key, tag_val in el.get("tags", {}).items():
+                        for tag in ((tag_key, tag_val), (tag_key, "*")):
+                            matches.update(dict.fromkeys(owners.get(tag, ())))
+                name_key = point[0].strip().lower()
+                for keyword in matches:
+                    if name_key in seen[keyword]:
+                        continue
+                    seen[keyword].add(name_key)
+                    found[keyword].append(_overpass_poi(el, point, dist, keyword))
+
+            for keyword, results in found.items():
+                log.debug("search_nearby  Overpass found %d result(s) for '%s'",
+                          len(results), keyword)
+                out[keyword], complete = _supplement(results, keyword,
+                                                     clat, clon, reach_m)
+                if not complete:
+                    busy.add(keyword)
+
+        except Exception as exc:
+            log.warning("search_nearby  Overpass failed: %s — falling back to Nominatim", exc)
+            if isinstance(exc, _UpstreamBusy):
+                busy.update(tagged)
+            for keyword in tagged:
+                out[keyword] = nominatim_only(keyword)
+
+    for keyword, cache_key in pending.items():
+        if keyword not in busy:
+            _cache_set(_NEARBY_CACHE, cache_key, out[keyword])
+        out[keyword] = _relocate_pois(out[keyword], lat, lon, radius_m)
+    return out
+
+
+def _nearby_cell(lat: float, lon: float,
+                 radius_m: float) -> tuple[int, int, float, float, int]:
+    """
+    Snap (*lat*, *lon*) to a grid cell sized to *radius_m*.
 
-    except Exception as exc:
-        log.warning("search_nearby  Overpass failed: %s — falling back to Nominatim", exc)
-        final = _nominatim_nearby(keyword, lat, lon, radius_m)
-        _cache_set(_NEARBY_CACHE, cache_key, final)
-        return final
+    Returns ``(row, col, centre_lat, centre_lon, reach_m)``: the cell's grid
+    indices (for the cache key), its centre, and the search radius from the
+    centre that covers *radius_m* around every point in the cell.
+    """
+    step = min(radius_m * _NEARBY_CELL_FRACTION / _M_PER_DEG_LAT, _NEARBY_CELL_MAX_DEG)
+    row = math.floor(lat / step)
+    clat = (row + 0.5) * step
+    # Equator-side edge: the cell's widest row in metres
+    cos_edge = max(math.cos(row * step * _DEG2RAD), math.cos((row + 1) * step * _DEG2RAD))
+    lon_step = step / max(math.cos(clat * _DEG2RAD), 1e-9)
+    col = math.floor(lon / lon_step)
+    clon = (col + 0.5) * lon_step
+    half_diag = 0.5 * _M_PER_DEG_LAT * math.hypot(step, lon_step * cos_edge)
+    return row, col, clat, clon, int(radius_m + half_diag) + 1
+
+
+def _relocate_pois(pois: list[dict], lat: float, lon: float,
+                   radius_m: float) -> list[dict]:
+    """
+    Return copies of a cell's *pois* with ``distance_m`` re-measured from
+    (*lat*, *lon*), dropping those beyond *radius_m*; nearest first, capped
+    at ``POI_MAX_RESULTS``.  Cached lists are never mutated.
+    """
+    dists = _haversine_from(lat, lon, [(poi["lat"], poi["lon"]) for poi in pois])
+    moved = [
+        {**poi, "distance_m": round(dist)}
+        for poi, dist in zip(pois, dists)
+        if dist <= radius_m
+    ]
+    moved.sort(key=lambda x: x["distance_m"])
+    return moved[:POI_MAX_RESULTS]
 
 
 def _nominatim_nearby(keyword: str, lat: float, lon: float,
@@ -843,7 +1279,7 @@ def _nominatim_nearby(keyword: str, lat: float, lon: float,
     """
     deg_offset = max(radius_m / 111_000, 0.05)
     try:
-        r = _session.get(
+        r = _nominatim_get(
             NOMINATIM_BASE,
             params={
                 "q":            keyword,
@@ -858,27 +1294,160 @@ def _nominatim_nearby(keyword: str, lat: float, lon: float,
             timeout=TIMEOUT,
         )
         r.raise_for_status()
+        items = _json(r)
+        dists = _haversine_from(
+            lat, lon, [(float(item["lat"]), float(item["lon"])) for item in items])
         results = [
             {
-                "name":       item.get("display_name", "").split(",")[0].strip(),
+                "name":       item.get("display_name", "").partition(",")[0].strip(),
                 "lat":        round(float(item["lat"]), 6),
                 "lon":        round(float(item["lon"]), 6),
                 "type":       item.get("type", "place"),
                 "address":    item.get("display_name"),
-                "distance_m": round(_haversine(lat, lon,
-                                               float(item["lat"]),
-                                               float(item["lon"]))),
+                "distance_m": round(dist),
                 "extra":      None,
             }
-            for item in r.json()
+            for item, dist in zip(items, dists)
         ]
         results.sort(key=lambda x: x["distance_m"])
         return results[:NOMINATIM_NEARBY_LIMIT]
+    except _UpstreamBusy:
+        raise               # callers must not cache a refusal as "nothing here"
     except Exception as exc:
         log.warning("_nominatim_nearby  failed: %s", exc)
         return []
 
 
+# ---------------------------------------------------------------------------
+# Local place-name prefix index
+# ---------------------------------------------------------------------------
+
+PLACE_INDEX_MAX = 20_000   # cap on indexed place names (seed + learned)
+
+# Seed: major Indian cities as (name, sublabel, lat, lon), most populous first
+_SEED_PLACES: tuple[tuple[str, str, float, float], ...] = (
+    ("Mumbai",             "Maharashtra, India",       19.0760, 72.8777),
+    ("Delhi",              "Delhi, India",             28.7041, 77.1025),
+    ("Bengaluru",          "Karnataka, India",         12.9716, 77.5946),
+    ("Bangalore",          "Karnataka, India",         12.9716, 77.5946),
+    ("Hyderabad",          "Telangana, India",         17.3850, 78.4867),
+    ("Ahmedabad",          "Gujarat, India",           23.0225, 72.5714),
+    ("Chennai",            "Tamil Nadu, India",        13.0827, 80.2707),
+    ("Kolkata",            "West Bengal, India",       22.5726, 88.3639),
+    ("Surat",              "Gujarat, India",           21.1702, 72.8311),
+    ("Pune",               "Maharashtra, India",       18.5204, 73.8567),
+    ("Jaipur",             "Rajasthan, India",         26.9124, 75.7873),
+    ("Lucknow",            "Uttar Pradesh, India",     26.8467, 80.9462),
+    ("Kanpur",             "Uttar Pradesh, India",     26.4499, 80.3319),
+    ("Nagpur",             "Maharashtra, India",       21.1458, 79.0882),
+    ("Indore",             "Madhya Pradesh, India",    22.7196, 75.8577),
+    ("Thane",              "Maharashtra, India",       19.2183, 72.9781),
+    ("Bhopal",             "Madhya Pradesh, India",    23.2599, 77.4126),
+    ("Visakhapatnam",      "Andhra Pradesh, India",    17.6868, 83.2185),
+    ("Patna",              "Bihar, India",             25.5941, 85.1376),
+    ("Vadodara",           "Gujarat, India",           22.3072, 73.1812),
+    ("Ghaziabad",          "Uttar Pradesh, India",     28.6692, 77.4538),
+    ("Ludhiana",           "Punjab, India",            30.9010, 75.8573),
+    ("Agra",               "Uttar Pradesh, India",     27.1767, 78.0081),
+    ("Nashik",             "Maharashtra, India",       19.9975, 73.7898),
+    ("Faridabad",          "Haryana, India",           28.4089, 77.3178),
+    ("Meerut",             "Uttar Pradesh, India",     28.9845, 77.7064),
+    ("Rajkot",             "Gujarat, India",           22.3039, 70.8022),
+    ("Varanasi",           "Uttar Pradesh, India",     25.3176, 82.9739),
+    ("Srinagar",           "Jammu and Kashmir, India", 34.0837, 74.7973),
+    ("Aurangabad",         "Maharashtra, India",       19.8762, 75.3433),
+    ("Amritsar",           "Punjab, India",            31.6340, 74.8723),
+    ("Navi Mumbai",        "Maharashtra, India",       19.0330, 73.0297),
+    ("Ranchi",             "Jharkhand, India",         23.3441, 85.3096),
+    ("Coimbatore",         "Tamil Nadu, India",        11.0168, 76.9558),
+    ("Jabalpur",           "Madhya Pradesh, India",    23.1815, 79.9864),
+    ("Gwalior",            "Madhya Pradesh, India",    26.2183, 78.1828),
+    ("Vijayawada",         "Andhra Pradesh, India",    16.5062, 80.6480),
+    ("Jodhpur",            "Rajasthan, India",         26.2389, 73.0243),
+    ("Madurai",            "Tamil Nadu, India",         9.9252, 78.1198),
+    ("Raipur",             "Chhattisgarh, India",      21.2514, 81.6296),
+    ("Kota",               "Rajasthan, India",         25.2138, 75.8648),
+    ("Guwahati",           "Assam, India",             26.1445, 91.7362),
+    ("Chandigarh",         "Chandigarh, India",        30.7333, 76.7794),
+    ("Solapur",            "Maharashtra, India",       17.6599, 75.9064),
+    ("Mysuru",             "Karnataka, India",         12.2958, 76.6394),
+    ("Thiruvananthapuram", "Kerala, India",             8.5241, 76.9366),
+    ("Kochi",              "Kerala, India",             9.9312, 76.2673),
+    ("Bhubaneswar",        "Odisha, India",            20.2961, 85.8245),
+    ("Noida",              "Uttar Pradesh, India",     28.5355, 77.3910),
+    ("Gurugram",           "Haryana, India",           28.4595, 77.0266),
+    ("Dehradun",           "Uttarakhand, India",       30.3165, 78.0322),
+    ("Kolhapur",           "Maharashtra, India",       16.7050, 74.2433),
+    ("Udaipur",            "Rajasthan, India",         24.5854, 73.7125),
+    ("Mangaluru",          "Karnataka, India",         12.9141, 74.8560),
+    ("Puducherry",         "Puducherry, India",        11.9416, 79.8083),
+    ("Panaji",             "Goa, India",               15.4909, 73.8278),
+    ("Shimla",             "Himachal Pradesh, India",  31.1048, 77.1734),
+    ("New Delhi",          "Delhi, India",             28.6139, 77.2090),
+)
+
+
+class _PrefixIndex:
+    """
+    Sorted-key prefix index over normalised place names.
+
+    A stdlib stand-in for a trie: keys live in one sorted list, so all
+    completions of a prefix are a contiguous run found with ``bisect``.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._keys: list[str] = []
+        self._items: dict[str, dict] = {}
+        self._lock = Lock()
+
+    def add(self, item: dict) -> None:
+        key = _normalize_search_text(item.get("label", ""))
+        if not key:
+            return
+        with self._lock:
+            if key in self._items or len(self._keys) >= self.maxsize:
+                return
+            insort(self._keys, key)
+            self._items[key] = {**item, "_rank": len(self._items)}
+
+    def search(self, prefix: str,
+               lat: Optional[float] = None,
+               lon: Optional[float] = None,
+               limit: int = 8,
+               scan: int = 64) -> list[dict]:
+        """
+        Return up to *limit* items whose name starts with *prefix*.
+
+        At most *scan* completions are considered; they are ordered by
+        distance from (*lat*, *lon*) when given, else by insertion order.
+        """
+        p = _normalize_search_text(prefix)
+        if not p:
+            return []
+        with self._lock:
+            i = bisect_left(self._keys, p)
+            hits = []
+            while i < len(self._keys) and len(hits) < scan:
+                key = self._keys[i]
+                if not key.startswith(p):
+                    break
+                hits.append(self._items[key])
+                i += 1
+        if lat is not None and lon is not None:
+            dists = _haversine_from(lat, lon, [(it["lat"], it["lon"]) for it in hits])
+            hits = [it for _, it in sorted(zip(dists, hits), key=lambda pair: pair[0])]
+        else:
+            hits.sort(key=lambda it: it["_rank"])
+        return [{k: v for k, v in it.items() if k != "_rank"} for it in hits[:limit]]
+
+
+_PLACE_INDEX = _PrefixIndex(PLACE_INDEX_MAX)
+for _name, _sub, _lat, _lon in _SEED_PLACES:
+    _PLACE_INDEX.add({"label": _name, "sublabel": _sub, "type": "city",
+                      "lat": _lat, "lon": _lon, "query": _name})
+
+
 # ---------------------------------------------------------------------------
 # Autocomplete suggestions
 # ---------------------------------------------------------------------------
@@ -890,16 +1459,20 @@ def get_suggestions(query: str,
     """
     Return autocomplete suggestions for the search bar.
 
-    Combines Nominatim place results with POI keyword hints when the query
-    looks like a "near me"-style search.  Returns up to *limit* items.
+    Combines POI keyword hints (for "near me"-style queries), the local
+    place-name prefix index, and Nominatim place results.  Nominatim is only
+    called when the first two cannot fill *limit* items; its place-type
+    answers are fed back into the index.  Returns up to *limit* items.
     """
     if not query or len(query.strip()) < 2:
         return []
 
+    # Location only biases ranking (Nominatim viewbox is ±2°), so a ~11 km
+    # cell is plenty — everyone typing "del" in one city shares an answer.
     cache_key = (
         query.strip().lower(),
-        _round_coord(lat, 3),
-        _round_coord(lon, 3),
+        _round_coord(lat, 1),
+        _round_coord(lon, 1),
         int(limit),
     )
     hit, cached = _cache_get(_SUGGEST_CACHE, cache_key)
@@ -912,22 +1485,18 @@ def get_suggestions(query: str,
     # POI keyword suggestions
     kw = _extract_poi_keyword(query)
     if kw:
-        base = query.lower()
-        for phrase in _NEAR_PHRASES:
-            base = base.replace(phrase, "")
-        base = base.strip()
-
-        for key in POI_TAG_MAP:
-            if key.startswith(base):
-                for suffix in (" near me", " nearby"):
-                    label = f"{key.title()}{suffix}"
-                    if label not in seen:
-                        seen.add(label)
-                        results.append({
-                            "label": label,
-                            "type":  "poi",
-                            "query": label.lower(),
-                        })
+        base = _NEAR_RE.sub(" ", query.lower()).strip()
+
+        for key in _poi_keys_with_prefix(base):
+            for suffix in (" near me", " nearby"):
+                label = f"{key.title()}{suffix}"
+                if label not in seen:
+                    seen.add(label)
+                    results.append({
+                        "label": label,
+                        "type":  "poi",
+                        "query": label.lower(),
+                    })
 
         for suffix in (" near me", " nearby"):
             label = base + suffix
@@ -939,6 +1508,18 @@ def get_suggestions(query: str,
                     "query": label,
                 })
 
+    # Local prefix-index place suggestions
+    for item in _PLACE_INDEX.search(query, lat, lon, limit=limit):
+        key = item["label"].lower()
+        if key not in seen:
+            seen.add(key)
+            results.append(item)
+
+    if len(results) >= limit:
+        final = results[:limit]
+        _cache_set(_SUGGEST_CACHE, cache_key, final)
+        return final
+
     # Nominatim place suggestions
     try:
         params: dict = {
@@ -953,31 +1534,40 @@ def get_suggestions(query: str,
             params["viewbox"] = f"{lon - 2},{lat + 2},{lon + 2},{lat - 2}"
             params["bounded"] = 0
 
-        r = _session.get(NOMINATIM_BASE, params=params, timeout=10)
+        # Typing outpaces the 1 req/s budget: rather than queue a keystroke
+        # that the next one will supersede, drop it and serve local hits.
+        r = _nominatim_get(NOMINATIM_BASE, params=params, timeout=(CONNECT_TIMEOUT, 10),
+                           max_wait_s=SUGGEST_MAX_QUEUE_S)
         r.raise_for_status()
 
         sorted_items = sorted(
-            r.json(),
+            _json(r),
             key=lambda item: _score_geocode_candidate(query, item, user_lat=lat, user_lon=lon),
             reverse=True,
         )
 
         for item in sorted_items:
-            display = item.get("display_name", "")
-            parts   = [p.strip() for p in display.split(",")]
-            short   = parts[0]
-            sublabel = ", ".join(parts[1:4]) if len(parts) > 1 else ""
+            short, sublabel = _split_display_name(item.get("display_name", ""))
             key     = short.lower()
             if key not in seen:
                 seen.add(key)
-                results.append({
+                suggestion = {
                     "label":    short,
                     "sublabel": sublabel,
                     "type":     item.get("type", "place"),
                     "lat":      float(item["lat"]),
                     "lon":      float(item["lon"]),
                     "query":    short,
-                })
+                }
+                results.append(suggestion)
+                if (suggestion["type"] in _GEOCODE_PLACE_TYPES
+                        or item.get("class") == "place"):
+                    _PLACE_INDEX.add(suggestion)
+    except _UpstreamBusy:
+        # Superseded keystroke — answer from local sources, but don't cache
+        # the partial list over what a later Nominatim call would return.
+        log.debug("get_suggestions  Nominatim queue full for '%s'", query)
+        return results[:limit]
     except Exception as exc:
         log.warning("get_suggestions  Nominatim failed: %s", exc)
 
@@ -990,87 +1580,60 @@ def get_suggestions(query: str,
 # Geocoding
 # ---------------------------------------------------------------------------
 
-def geocode(place_name: str,
-            user_lat: Optional[float] = None,
-            user_lon: Optional[float] = None) -> Optional[dict]:
-    """
-    Convert a place name to ``{"lat": float, "lon": float}``.
-
-    Resolution order:
-    1. **City-biased Nominatim** — tight viewbox around the user's location
-       (bounded=1, then bounded=0), accepting results within
-       ``GEOCODE_CITY_MAX_DIST`` metres of the user.
-    2. **Nominatim India** — India-restricted search with no viewbox.
-    3. **Nominatim global** — global search; result accepted only if inside
-       India's bounding box.
-    4. **Photon (Komoot)** — last resort; result accepted only if in India.
-
-    Returns ``None`` if every strategy fails.
-    """
-    if not place_name or not place_name.strip():
-        log.warning("geocode  called with empty place_name")
-        return None
-
-    cache_key = (
-        place_name.strip().lower(),
-        _round_coord(user_lat, 4),
-        _round_coord(user_lon, 4),
-    )
-    hit, cached = _cache_get(_GEOCODE_CACHE, cache_key)
-    if hit:
-        return cached
-
-    generic_query = _looks_generic_destination(place_name)
-
-    # 1. City-biased search (strict viewbox first, then relaxed)
-    if user_lat is not None and user_lon is not None:
-        box = CITY_GEOCODE_BOX_DEG
-        viewbox = (f"{user_lon - box},{user_lat + box},"
-                   f"{user_lon + box},{user_lat - box}")
-        for bounded in (1, 0):
-            try:
-                r = _session.get(
-                    NOMINATIM_BASE,
-                    params={
-                        "q":              place_name,
-                        "format":         "json",
-                        "limit":          5,
-                        "countrycodes":   "in",
-                        "viewbox":        viewbox,
-                        "bounded":        bounded,
-                        "addressdetails": 1,
-                    },
-                    timeout=TIMEOUT,
+def _geocode_city_biased(place_name: str, user_lat: float, user_lon: float,
+                         generic_query: bool) -> Optional[dict]:
+    """Stage 1 — Nominatim in a tight viewbox around the user (bounded=1, then 0)."""
+    box = CITY_GEOCODE_BOX_DEG
+    viewbox = (f"{user_lon - box},{user_lat + box},"
+               f"{user_lon + box},{user_lat - box}")
+    for bounded in (1, 0):
+        try:
+            r = _nominatim_get(
+                NOMINATIM_BASE,
+                params={
+                    "q":              place_name,
+                    "format":         "json",
+                    "limit":          5,
+                    "countrycodes":   "in",
+                    "viewbox":        viewbox,
+                    "bounded":        bounded,
+                    "addressdetails": 1,
+                },
+                timeout=TIMEOUT,
+            )
+            r.raise_for_status()
+            data = _json(r)
+            if data:
+                candidate = _choose_best_geocode_candidate(
+                    place_name,
+                    data,
+                    user_lat=user_lat,
+                    user_lon=user_lon,
+                    max_dist_m=GEOCODE_CITY_MAX_DIST,
+                    min_score=30 if generic_query else 110,
                 )
-                r.raise_for_status()
-                data = r.json()
-                if data:
-                    candidate = _choose_best_geocode_candidate(
-                        place_name,
-                        data,
-                        user_lat=user_lat,
-                        user_lon=user_lon,
-                        max_dist_m=GEOCODE_CITY_MAX_DIST,
-                        min_score=30 if generic_query else 110,
-                    )
-                    if candidate:
-                        rlat = float(candidate["lat"])
-                        rlon = float(candidate["lon"])
+                if candidate:
+                    rlat = float(candidate["lat"])
+                    rlon = float(candidate["lon"])
+                    if log.isEnabledFor(logging.DEBUG):   # distance is for the log only
                         dist = _haversine(user_lat, user_lon, rlat, rlon)
                         log.debug("geocode  '%s' city-biased (bounded=%d): "
                                   "%.4f,%.4f  dist=%.1fkm",
                                   place_name, bounded, rlat, rlon, dist / 1000)
-                        return _cache_return(
-                            _GEOCODE_CACHE,
-                            cache_key,
-                            {"lat": rlat, "lon": rlon},
-                        )
-            except Exception as exc:
-                log.warning("geocode  city-biased search failed: %s", exc)
-
-    # 2. Nominatim India-restricted
+                    return {"lat": rlat, "lon": rlon}
+        except _UpstreamBusy:
+            raise               # a refusal, not a miss — see _run_geocode_stage
+        except Exception as exc:
+            log.warning("geocode  city-biased search failed: %s", exc)
+    return None
+
+
+def _geocode_nominatim_india(place_name: str, user_lat: Optional[float],
+                             user_lon: Optional[float],
+                             generic_query: bool) -> Optional[dict]:
+    """Stage 2 — India-restricted Nominatim search with no viewbox bound."""
     try:
-        r = _session.get(
+        r = _nominatim_get(
             NOMINATIM_BASE,
             params={
                 "q":              place_name,
@@ -1084,7 +1647,7 @@ def geocode(place_name: str,
             timeout=TIMEOUT,
         )
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         if data:
             candidate = _choose_best_geocode_candidate(
                 place_name,
@@ -1096,17 +1659,20 @@ def geocode(place_name: str,
             if candidate:
                 log.debug("geocode  '%s' via Nominatim-India: %s, %s",
                           place_name, candidate["lat"], candidate["lon"])
-                return _cache_return(
-                    _GEOCODE_CACHE,
-                    cache_key,
-                    {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])},
-                )
+                return {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])}
+    except _UpstreamBusy:
+        raise
     except Exception as exc:
         log.warning("geocode  Nominatim-India failed: %s", exc)
+    return None
+
 
-    # 3. Nominatim global (India bbox guard)
+def _geocode_nominatim_global(place_name: str, user_lat: Optional[float],
+                              user_lon: Optional[float],
+                              generic_query: bool) -> Optional[dict]:
+    """Stage 3 — global Nominatim search; only results inside India's bbox count."""
     try:
-        r = _session.get(
+        r = _nominatim_get(
             NOMINATIM_BASE,
             params={
                 "q": place_name,
@@ -1117,7 +1683,7 @@ def geocode(place_name: str,
             timeout=TIMEOUT,
         )
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
         if data:
             india_candidates = []
             for item in data:
@@ -1137,25 +1703,28 @@ def geocode(place_name: str,
             )
             if candidate:
                 log.debug("geocode  '%s' via Nominatim-global", place_name)
-                return _cache_return(
-                    _GEOCODE_CACHE,
-                    cache_key,
-                    {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])},
-                )
+                return {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])}
             log.debug("geocode  Nominatim-global results outside India or low-confidence")
+    except _UpstreamBusy:
+        raise
     except Exception as exc:
         log.warning("geocode  Nominatim-global failed: %s", exc)
+    return None
 
-    # 4. Photon (Komoot) — final fallback
+
+def _geocode_photon(place_name: str, user_lat: Optional[float],
+                    user_lon: Optional[float],
+                    generic_query: bool) -> Optional[dict]:
+    """Stage 4 — Photon (Komoot); only results inside India count."""
     try:
-        r = _session.get(
+        r = _photon_get(
             PHOTON_BASE,
             params={"q": place_name, "limit": 3, "lang": "en"},
             timeout=TIMEOUT,
         )
         r.raise_for_status()
         photon_candidates: list[dict] = []
-        for feature in r.json().get("features", []):
+        for feature in _json(r).get("features", []):
             rlon, rlat = feature["geometry"]["coordinates"]
             if not _in_india(float(rlat), float(rlon)):
                 continue
@@ -1184,14 +1753,98 @@ def geocode(place_name: str,
         )
         if candidate:
             log.debug("geocode  '%s' via Photon", place_name)
-            return _cache_return(
-                _GEOCODE_CACHE,
-                cache_key,
-                {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])},
-            )
+            return {"lat": float(candidate["lat"]), "lon": float(candidate["lon"])}
+    except _UpstreamBusy:
+        raise
     except Exception as exc:
         log.warning("geocode  Photon failed: %s", exc)
+    return None
 
+
+def _run_geocode_stage(stage, args: tuple) -> tuple[Optional[dict], bool]:
+    """
+    Run one geocode stage; return ``(result, refused)``.
+
+    *refused* is ``True`` when the stage's upstream gate turned the call away
+    with ``_UpstreamBusy`` — a "don't know", not a miss, so the caller must
+    not cache a negative answer on its account.
+    """
+    try:
+        return stage(*args), False
+    except _UpstreamBusy as exc:
+        log.warning("geocode  %s refused: %s", stage.__name__, exc)
+        return None, True
+
+
+def geocode(place_name: str,
+            user_lat: Optional[float] = None,
+            user_lon: Optional[float] = None) -> Optional[dict]:
+    """
+    Convert a place name to ``{"lat": float, "lon": float}``.
+
+    Resolution order:
+    1. **City-biased Nominatim** — tight viewbox around the user's location
+       (bounded=1, then bounded=0), accepting results within
+       ``GEOCODE_CITY_MAX_DIST`` metres of the user.
+    2. **Nominatim India** — India-restricted search with no viewbox.
+    3. **Nominatim global** — global search; result accepted only if inside
+       India's bounding box.
+    4. **Photon (Komoot)** — last resort; result accepted only if in India.
+
+    The Nominatim stages stay sequential (fair-use policy: one request at a
+    time), but Photon is a different host: it is fired in the background as
+    soon as the first stage misses, so a full miss costs max(), not sum().
+    Preference order is unchanged — a Photon hit only wins when every
+    Nominatim stage has failed.
+
+    Returns ``None`` if every strategy fails.  That negative is cached only
+    when every stage actually answered; if any was refused as busy by its
+    upstream gate the miss is not remembered.
+    """
+    if not place_name or not place_name.strip():
+        log.warning("geocode  called with empty place_name")
+        return None
+
+    # User position rounded to ~110 m: coarse enough that a moving user keeps
+    # hitting the cache, fine enough that "nearest hospital"-style generic
+    # queries are not answered for a different neighbourhood.
+    cache_key = (
+        place_name.strip().lower(),
+        _round_coord(user_lat, 3),
+        _round_coord(user_lon, 3),
+    )
+    hit, cached = _cache_get(_GEOCODE_CACHE, cache_key)
+    if hit:
+        return cached
+
+    generic_query = _looks_generic_destination(place_name)
+    args = (place_name, user_lat, user_lon, generic_query)
+
+    busy = False
+    if user_lat is not None and user_lon is not None:
+        result, refused = _run_geocode_stage(_geocode_city_biased, args)
+        if result:
+            return _cache_return(_GEOCODE_CACHE, cache_key, result)
+        busy |= refused
+
+    f_photon = _UPSTREAM_POOL.submit(_run_geocode_stage, _geocode_photon, args)
+    for stage in (_geocode_nominatim_india, _geocode_nominatim_global):
+        result, refused = _run_geocode_stage(stage, args)
+        if result:
+            f_photon.cancel()
+            return _cache_return(_GEOCODE_CACHE, cache_key, result)
+        busy |= refused
+
+    result, refused = f_photon.result()
+    if result:
+        return _cache_return(_GEOCODE_CACHE, cache_key, result)
+    busy |= refused
+
+    if busy:
+        # At least one stage never got to ask — a burst, not a real miss.
+        # Caching None here would hide the place for the whole TTL.
+        log.warning("geocode  no answer for '%s' (upstream busy, not cached)", place_name)
+        return None
     log.error("geocode  FAILED for '%s'", place_name)
     return _cache_return(_GEOCODE_CACHE, cache_key, None)
 
@@ -1210,7 +1863,8 @@ def _osrm_request(start_lat: float, start_lon: float,
     Make a single OSRM routing request, optionally via one waypoint.
 
     Returns a list of raw route dicts:
-    ``{"distance": float, "duration": float, "geometry": [[lon, lat], ...]}``.
+    ``{"distance": float, "duration": float, "geometry": [[lon, lat], ...]}``
+    with at least two coordinates, ready for ``score_routes`` as-is.
     An empty list is returned on any failure.
     """
     if via_lat is not None and via_lon is not None:
@@ -1231,9 +1885,11 @@ def _osrm_request(start_lat: float, start_lon: float,
     }
 
     try:
-        r = _osrm_session.get(url, params=params, timeout=timeout_s or _OSRM_TIMEOUT)
+        r = _osrm_session.get(
+            url, params=params,
+            timeout=(_OSRM_CONNECT_TIMEOUT, timeout_s or _OSRM_TIMEOUT))
         r.raise_for_status()
-        data = r.json()
+        data = _json(r)
 
         if data.get("code") != "Ok":
             log.warning("OSRM  error code: %s", data.get("code"))
@@ -1241,9 +1897,9 @@ def _osrm_request(start_lat: float, start_lon: float,
 
         routes = []
         for route in data.get("routes", []):
-            geom   = route.get("geometry", {})
-            coords = geom.get("coordinates", []) if isinstance(geom, dict) else []
-            if not coords:
+            geom   = route.get("geometry")
+            coords = geom.get("coordinates") if isinstance(geom, dict) else None
+            if not coords or len(coords) < 2:
                 continue
             routes.append({
                 "distance": float(route.get("distance", 0)),
@@ -1296,9 +1952,47 @@ def _recover_direct_route(start_lat: float, start_lon: float,
 # Via-waypoint generation
 # ---------------------------------------------------------------------------
 
+# City ring radii (fraction of the trip length) and the (cos, sin) of the
+# eight compass bearings they are sampled at, so no trig runs per call.
+_CITY_RING_FACTORS: tuple[float, ...] = (0.12, 0.22, 0.35)
+_CITY_BEARINGS: tuple[tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(deg)), math.sin(math.radians(deg)))
+    for deg in range(0, 360, 45)
+)
+# Ring × bearing folded into one table of (Δlat, Δlon) per unit segment
+# length, ring by ring, so the city layout is a single multiply-add pass.
+_CITY_OFFSETS: tuple[tuple[float, float], ...] = tuple(
+    (ring_f * cos_b, ring_f * sin_b)
+    for ring_f in _CITY_RING_FACTORS
+    for cos_b, sin_b in _CITY_BEARINGS
+)
+
+# Via-waypoint layouts as (t, p) pairs: the point lies a fraction t of the
+# way along start→end, shifted p segment-lengths perpendicular to it.  Order
+# matters — fetch_routes only tries the first max_via_tasks entries.
+_VIA_SHORT: tuple[tuple[float, float], ...] = (
+    (0.50, 0.12), (0.50, 0.20), (0.50, -0.12), (0.50, -0.20),    # midpoint micro offsets
+    (0.80, 0.10), (0.80, -0.10), (0.20, 0.10), (0.20, -0.10),    # ±30 % along, small offset
+    (0.25, 0.15), (0.25, -0.15), (0.75, 0.15), (0.75, -0.15),    # quarter points
+)
+_VIA_MEDIUM: tuple[tuple[float, float], ...] = (
+    (0.50, 0.15), (0.50, 0.25), (0.50, -0.15), (0.50, -0.25),    # perpendicular both sides
+    (0.25, 0.12), (0.25, -0.12), (0.75, 0.12), (0.75, -0.12),    # shifted quarter points
+)
+_VIA_LONG: tuple[tuple[float, float], ...] = (
+    (0.50, 0.18), (0.50, 0.30), (0.50, -0.18), (0.50, -0.30),    # perpendicular both sides
+    (0.75, 0.15), (0.25, 0.15),                                  # forward/backward bias
+)
+
+
+_VIA_LAYOUTS: dict[str, tuple[tuple[float, float], ...]] = {
+    "short": _VIA_SHORT, "medium": _VIA_MEDIUM, "long": _VIA_LONG,
+}
+
+
 def _via_points(start_lat: float, start_lon: float,
                 end_lat: float, end_lon: float,
-                dist_km: float) -> list[tuple[float, float]]:
+                dist_km: float) -> tuple[tuple[float, float], ...]:
     """
     Generate candidate via-waypoints for corridor exploration.
 
@@ -1306,150 +2000,214 @@ def _via_points(start_lat: float, start_lon: float,
     that very short routes (e.g. 500 m) get tight local alternatives rather
     than kilometre-wide detours.
 
-    Returns a list of (lat, lon) tuples.
-    """
-    mid_lat = (start_lat + end_lat) / 2.0
-    mid_lon = (start_lon + end_lon) / 2.0
-
-    dlat    = end_lat - start_lat
-    dlon    = end_lon - start_lon
-    seg_len = math.sqrt(dlat ** 2 + dlon ** 2) or 1e-9
-
-    # Unit perpendicular and parallel vectors in lat/lon space
-    perp_lat =  -dlon / seg_len
-    perp_lon =   dlat / seg_len
-    para_lat =   dlat / seg_len
-    para_lon =   dlon / seg_len
-
-    via: list[tuple[float, float]] = []
+    *dist_km* only selects the layout band, so results are memoised per
+    band and ~11 m endpoint cell (4 dp) — repeat trips such as home → office
+    reuse the same tuple.
 
+    Returns a tuple of (lat, lon) tuples.
+    """
     if dist_km < 2:
-        # ── Very short (<2 km): micro offsets for street-level alternatives ──
-        for perp_f in (0.12, 0.20, -0.12, -0.20):
-            off = seg_len * perp_f
-            via.append((mid_lat + perp_lat * off,
-                         mid_lon + perp_lon * off))
-
-        for para_f in (0.30, -0.30):
-            for perp_f in (0.10, -0.10):
-                via.append((
-                    mid_lat + para_lat * seg_len * para_f
-                            + perp_lat * seg_len * perp_f,
-                    mid_lon + para_lon * seg_len * para_f
-                            + perp_lon * seg_len * perp_f,
-                ))
-
-        for frac in (0.25, 0.75):
-            q_lat = start_lat + dlat * frac
-            q_lon = start_lon + dlon * frac
-            for perp_f in (0.15, -0.15):
-                off = seg_len * perp_f
-                via.append((q_lat + perp_lat * off,
-                             q_lon + perp_lon * off))
-
+        band = "short"
     elif dist_km < 15:
-        # ── City (2–15 km): radial sampling at 3 rings × 8 compass bearings ──
-        cos_lat = math.cos(math.radians(mid_lat)) or 1.0
-        ring_factors = (0.12, 0.22, 0.35)
-        angles_deg   = range(0, 360, 45)
-
-        for ring_f in ring_factors:
-            off = seg_len * ring_f
-            for deg in angles_deg:
-                rad  = math.radians(deg)
-                via.append((
-                    mid_lat + off * math.cos(rad),
-                    mid_lon + off * math.sin(rad) / cos_lat,
-                ))
-
+        band = "city"
     elif dist_km < 80:
-        # ── Medium (15–80 km): perpendicular both sides + shifted quarter-points ──
-        for perp_f in (0.15, 0.25, -0.15, -0.25):
-            off = seg_len * perp_f
-            via.append((mid_lat + perp_lat * off,
-                         mid_lon + perp_lon * off))
-
-        for frac in (0.25, 0.75):
-            q_lat = start_lat + dlat * frac
-            q_lon = start_lon + dlon * frac
-            for perp_f in (0.12, -0.12):
-                off = seg_len * perp_f
-                via.append((q_lat + perp_lat * off,
-                             q_lon + perp_lon * off))
-
+        band = "medium"
     else:
-        # ── Long (>80 km): perpendicular + forward/backward para bias ──
-        for perp_f in (0.18, 0.30, -0.18, -0.30):
-            off = seg_len * perp_f
-            via.append((mid_lat + perp_lat * off,
-                         mid_lon + perp_lon * off))
+        band = "long"
+    return _via_points_for(round(start_lat, 4), round(start_lon, 4),
+                           round(end_lat, 4), round(end_lon, 4), band)
 
-        for bias in (0.25, -0.25):
-            via.append((
-                mid_lat + para_lat * seg_len * bias
-                        + perp_lat * seg_len * 0.15,
-                mid_lon + para_lon * seg_len * bias
-                        + perp_lon * seg_len * 0.15,
-            ))
 
-    return via
+@lru_cache(maxsize=2048)
+def _via_points_for(start_lat: float, start_lon: float,
+                    end_lat: float, end_lon: float,
+                    band: str) -> tuple[tuple[float, float], ...]:
+    dlat = end_lat - start_lat
+    dlon = end_lon - start_lon
+
+    if band == "city":
+        # ── City (2–15 km): radial sampling at 3 rings × 8 compass bearings ──
+        mid_lat = (start_lat + end_lat) / 2.0
+        mid_lon = (start_lon + end_lon) / 2.0
+        # Coincident endpoints: rings collapse onto the midpoint.
+        seg_len = math.hypot(dlat, dlon) or 1e-9
+        # cos(lat) ∈ [0, 1] for valid latitudes; floor it rather than ``or 1``,
+        # which only caught an exact 0.0 and swapped in an unrelated scale.
+        cos_lat = max(math.cos(math.radians(mid_lat)), 1e-9)
+        lon_len = seg_len / cos_lat       # east-west degrees shrink with latitude
+        return tuple(
+            (mid_lat + seg_len * off_lat, mid_lon + lon_len * off_lon)
+            for off_lat, off_lon in _CITY_OFFSETS
+        )
+
+    # ── Very short (<2 km): street-level micro offsets; medium (15–80 km):
+    # perpendicular + quarter points; long (>80 km): perpendicular + para bias.
+    # The perpendicular of (dlat, dlon) scaled by the segment length is
+    # (-dlon, dlat), so each point is one multiply-add per axis.
+    return tuple(
+        (start_lat + dlat * t - dlon * p, start_lon + dlon * t + dlat * p)
+        for t, p in _VIA_LAYOUTS[band]
+    )
 
 
 # ---------------------------------------------------------------------------
 # Deduplication
 # ---------------------------------------------------------------------------
 
-def _is_duplicate(route: dict, accepted: list[dict],
-                  dist_thr: float = 0.04,
-                  geom_thr: float = 0.08,
-                  dur_thr:  float = 0.04) -> bool:
+# Relative thresholds for routes of 3 km and more (distance, geometry point
+# count, duration); shorter trips use the absolute 120 m floor instead.
+_DUP_DIST_THR = 0.04
+_DUP_GEOM_THR = 0.08
+_DUP_DUR_THR  = 0.04
+_DUP_SHORT_M  = 3000      # below this either route counts as "short"
+_DUP_SHORT_ABS_M = 120    # short routes closer than this in distance may be dups
+
+
+# Geometry fingerprint: every 10th vertex rounded to 4 dp (~11 m).  Shorter
+# polylines sample too few vertices to be told apart and use numbers only.
+_FINGERPRINT_STRIDE     = 10
+_FINGERPRINT_MIN_POINTS = 20
+
+
+def _geometry_fingerprint(geometry: list) -> Optional[int]:
+    """
+    Return a hash of *geometry*'s coarse shape, or ``None`` if it is too
+    short to fingerprint.
+
+    Via-waypoint calls often come back with the very corridor an earlier
+    call already returned; equal fingerprints flag those in one set lookup.
     """
-    Return ``True`` if *route* is too similar to any route in *accepted*.
+    if len(geometry) < _FINGERPRINT_MIN_POINTS:
+        return None
+    return hash(tuple(
+        (round(lon, 4), round(lat, 4))
+        for lon, lat in geometry[::_FINGERPRINT_STRIDE]
+    ))
+
+
+def _route_sig(route: dict) -> tuple[float, float, int]:
+    """
+    Return the ``(distance, duration, n_points)`` triple dedup compares on.
+
+    ``_osrm_request`` only emits routes with a non-empty ``geometry``, so the
+    key is read directly rather than through ``get()`` with a default list.
+    """
+    return route["distance"], route["duration"], len(route["geometry"])
+
+
+def _dup_kernel(d: float, dur: float, npts: int,
+                acc_dist: list[float], acc_dur: list[float], acc_npts: list[int],
+                dist_thr: float, geom_thr: float, dur_thr: float) -> bool:
+    """
+    Return ``True`` if the candidate is too similar to any accepted route.
 
     Similarity is judged by three relative thresholds (distance, duration,
     geometry point count) *plus* an absolute distance floor for short trips:
     two 800 m routes that differ by 80 m are on different streets and both
     deserve to be shown.
-    """
-    d    = route["distance"]
-    dur  = route["duration"]
-    npts = len(route.get("geometry", []))
-
-    for u in accepted:
-        ud    = u["distance"]
-        udur  = u["duration"]
-        upts  = len(u.get("geometry", []))
 
-        rel_dist = abs(ud - d)    / max(ud,   1.0)
-        rel_dur  = abs(udur - dur) / max(udur, 1.0)
-        rel_geom = abs(upts - npts) / max(upts, 1.0)
+    Accepted routes arrive as parallel number columns, so the loop does no
+    dict lookups or ``len(geometry)`` calls — each route's metrics are
+    extracted once, when it is accepted.
+    """
+    short = d < _DUP_SHORT_M
+    for ud, udur, upts in zip(acc_dist, acc_dur, acc_npts):
+        # Cheapest and most selective test first: most pairs are far apart
+        # in distance, so the duration and geometry ratios are rarely needed.
         abs_dist_diff = abs(ud - d)
-
-        if d < 3000 or ud < 3000:
+        if short or ud < _DUP_SHORT_M:
             # Short route: require at least 120 m OR 6 % difference
-            if abs_dist_diff < 120 and rel_dur < 0.06 and rel_geom < 0.10:
-                return True
+            if abs_dist_diff >= _DUP_SHORT_ABS_M:
+                continue
+            max_rel_dur, max_rel_geom = 0.06, 0.10
         else:
-            if rel_dist < dist_thr and rel_dur < dur_thr and rel_geom < geom_thr:
-                return True
+            if abs_dist_diff / max(ud, 1.0) >= dist_thr:
+                continue
+            max_rel_dur, max_rel_geom = dur_thr, geom_thr
+
+        if abs(udur - dur) / max(udur, 1.0) >= max_rel_dur:
+            continue
+        if abs(upts - npts) / max(upts, 1.0) < max_rel_geom:
+            return True
 
     return False
 
 
-def _dedupe_and_sort_routes(routes: list[dict]) -> list[dict]:
+def _dup_window(d: float) -> tuple[float, float]:
+    """
+    Distance range an accepted route must fall in to possibly duplicate *d*.
+
+    Both branches of ``_dup_kernel`` need ``|ud - d|`` below 120 m (short) or
+    below ``_DUP_DIST_THR * ud`` (long), so anything outside
+    ``[d / (1 + thr), d / (1 - thr)]`` widened to ±120 m can never match.
+    The extra metre of slack keeps float rounding on the safe side.
+    """
+    return (min(d - _DUP_SHORT_ABS_M, d / (1.0 + _DUP_DIST_THR)) - 1.0,
+            max(d + _DUP_SHORT_ABS_M, d / (1.0 - _DUP_DIST_THR)) + 1.0)
+
+
+class _RouteDeduper:
     """
-    Return routes sorted by duration after removing near-duplicates.
+    Streaming near-duplicate filter and top-*cap* selector for OSRM routes.
 
-    Keeping this logic in one helper lets ``fetch_routes()`` re-check the
-    collected pool after each small batch of OSRM calls and stop early once
-    enough distinct routes are available.
+    The metrics dedup compares on live in three parallel columns sorted by
+    distance.  ``fetch_routes()`` feeds each batch of OSRM results through
+    ``add()`` as it arrives, so every route's metrics are extracted once and
+    only the ``_dup_window`` slice of the columns is compared.
+
+    A route whose geometry fingerprint was already seen is dropped before
+    the numeric comparison; rejected routes' fingerprints are remembered
+    too, since a copy of a duplicate fails the numeric check the same way.
+
+    Accepted routes also go into a bounded max-heap of the *cap* fastest,
+    so ranking never sorts the whole pool.  Dedup still checks against
+    every accepted route, including ones pushed out of the heap, which
+    keeps the result identical to a dedupe-then-sort over the full pool.
     """
-    unique: list[dict] = []
-    for route in routes:
-        if not _is_duplicate(route, unique):
-            unique.append(route)
-    unique.sort(key=lambda r: r["duration"])
-    return unique
+
+    def __init__(self, cap: int) -> None:
+        self.cap = cap
+        self._dist: list[float] = []     # ascending
+        self._dur:  list[float] = []
+        self._npts: list[int]   = []
+        self._seen: set[int] = set()     # fingerprints of accepted + rejected
+        # (-duration, -arrival, route): the root is the slowest kept route,
+        # latest arrival first on ties — what a stable sort would drop.
+        self._heap: list[tuple[float, int, dict]] = []
+
+    def __len__(self) -> int:
+        return len(self._dist)
+
+    def add(self, routes: list[dict]) -> None:
+        heap = self._heap
+        seen = self._seen
+        for route in routes:
+            fp = _geometry_fingerprint(route["geometry"])
+            if fp is not None:
+                if fp in seen:
+                    continue
+                seen.add(fp)
+            d, dur, npts = _route_sig(route)
+            lo, hi = _dup_window(d)
+            i, j = bisect_left(self._dist, lo), bisect_left(self._dist, hi)
+            if _dup_kernel(d, dur, npts,
+                           self._dist[i:j], self._dur[i:j], self._npts[i:j],
+                           _DUP_DIST_THR, _DUP_GEOM_THR, _DUP_DUR_THR):
+                continue
+            k = bisect_right(self._dist, d)
+            self._dist.insert(k, d)
+            self._dur.insert(k, dur)
+            self._npts.insert(k, npts)
+
+            entry = (-dur, -len(self._dist), route)
+            if len(heap) < self.cap:
+                heapq.heappush(heap, entry)
+            elif dur < -heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    def fastest(self) -> list[dict]:
+        """Return the (up to) *cap* fastest accepted routes, fastest first."""
+        return [route for _, _, route in sorted(self._heap, reverse=True)]
 
 
 # ---------------------------------------------------------------------------
@@ -1458,18 +2216,25 @@ def _dedupe_and_sort_routes(routes: list[dict]) -> list[dict]:
 
 def fetch_routes(start_lat: float, start_lon: float,
                  end_lat: float, end_lon: float,
-                 max_routes: int = 5) -> list[dict]:
+                 max_routes: int = 5,
+                 snapped_start: Optional[tuple[float, float]] = None) -> list[dict]:
     """
     Fetch up to *max_routes* distinct driving routes between two points.
 
+    *snapped_start* lets callers that already snapped the start point (e.g.
+    ``/route``, which snaps it while the destination is still being geocoded)
+    skip the second ``_snap_to_road`` round-trip.
+
     Steps:
     1. Snap both endpoints to the nearest drivable road node **in parallel**.
     2. Run the direct OSRM call first (no via-waypoint) synchronously.
     3. If that fast direct call fails, retry one relaxed direct request with a
        longer timeout and then once more with the original unsnapped endpoints.
     4. Only after at least one direct route is recovered, fan out via-waypoint
-       calls in short batches to look for distinct alternatives.
-    5. Deduplicate the collected pool and return the fastest ``cap`` routes.
+       calls through a sliding window of ``_OSRM_WORKERS`` in-flight requests,
+       stopping as soon as enough distinct alternatives are found.
+    5. Return the fastest ``cap`` routes of the pool, which is deduplicated
+       incrementally as each OSRM result arrives.
 
     Route cap by distance:
     - < 15 km → max 5 routes
@@ -1484,14 +2249,25 @@ def fetch_routes(start_lat: float, start_lon: float,
     orig_end_lat, orig_end_lon = end_lat, end_lon
 
     # ── Step 1: Snap both endpoints in parallel ───────────────────────────
-    with ThreadPoolExecutor(max_workers=2) as snap_pool:
-        f_start = snap_pool.submit(_snap_to_road, start_lat, start_lon)
-        f_end   = snap_pool.submit(_snap_to_road, end_lat,   end_lon)
-        start_lat, start_lon = f_start.result()
-        end_lat,   end_lon   = f_end.result()
-
-    dist_km = math.sqrt((end_lat - start_lat) ** 2 +
-                        (end_lon - start_lon) ** 2) * 111.0
+    # The user's location and popular destinations repeat, so check the snap
+    # cache first and only start a pool when both endpoints need OSRM.
+    if snapped_start is None:
+        snapped_start = _snap_from_cache(start_lat, start_lon)
+    snapped_end = _snap_from_cache(end_lat, end_lon)
+    if snapped_start is not None or snapped_end is not None:
+        start_lat, start_lon = snapped_start or _snap_to_road(start_lat, start_lon)
+        end_lat,   end_lon   = snapped_end   or _snap_to_road(end_lat,   end_lon)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as snap_pool:
+            f_start = snap_pool.submit(_snap_to_road, start_lat, start_lon)
+            f_end   = snap_pool.submit(_snap_to_road, end_lat,   end_lon)
+            start_lat, start_lon = f_start.result()
+            end_lat,   end_lon   = f_end.result()
+
+    # Great-circle rather than ``111 * sqrt(Δlat² + Δlon²)``: the flat-earth
+    # estimate overstates east-west trips by ~1/cos(lat) (≈ 13 % at Delhi),
+    # which skews both the route cap and the via-point layout chosen below.
+    dist_km = _haversine(start_lat, start_lon, end_lat, end_lon) / 1000.0
     deadline = time.monotonic() + _OSRM_TOTAL_BUDGET
 
     log.debug("fetch_routes  estimated distance: %.1f km", dist_km)
@@ -1519,9 +2295,10 @@ def fetch_routes(start_lat: float, start_lon: float,
             orig_end_lat, orig_end_lon,
         )
     log.debug("fetch_routes  direct: %d route(s)", len(all_routes))
-    unique = _dedupe_and_sort_routes(all_routes)
+    dedup = _RouteDeduper(cap)
+    dedup.add(all_routes)
 
-    if not unique:
+    if not dedup:
         log.warning("fetch_routes  no direct route recovered; skipping via exploration")
         return []
 
@@ -1533,7 +2310,7 @@ def fetch_routes(start_lat: float, start_lon: float,
     else:
         max_via_tasks = 4
 
-    if len(unique) < cap:
+    if len(dedup) < cap:
         via_points = _via_points(start_lat, start_lon, end_lat, end_lon, dist_km)
         via_tasks = [
             (start_lat, start_lon, end_lat, end_lon, vlat, vlon, 2)
@@ -1544,48 +2321,56 @@ def fetch_routes(start_lat: float, start_lon: float,
             log.debug("fetch_routes  submitting up to %d via task(s) with %d worker(s)",
                       len(via_tasks), _OSRM_WORKERS)
 
-            for batch_start in range(0, len(via_tasks), _OSRM_WORKERS):
-                if time.monotonic() >= deadline:
-                    log.warning("fetch_routes  OSRM budget exhausted before batch %d",
-                                (batch_start // _OSRM_WORKERS) + 1)
-                    break
-
-                batch = via_tasks[batch_start: batch_start + _OSRM_WORKERS]
-                n_workers = min(len(batch), _OSRM_WORKERS)
-                batch_results: list[dict] = []
-
-                with ThreadPoolExecutor(max_workers=n_workers) as pool:
-                    futures: dict = {}
-                    for offset, task in enumerate(batch):
-                        task_idx = batch_start + offset
-                        futures[pool.submit(_osrm_request, *task)] = task_idx
-                        if offset < len(batch) - 1:
+            # Sliding window rather than fixed batches: a finished call frees
+            # its slot for the next via task at once, so one slow request no
+            # longer holds back a whole batch, and the pool is re-checked for
+            # enough distinct routes after every completion.
+            pool = ThreadPoolExecutor(max_workers=_OSRM_WORKERS,
+                                      thread_name_prefix="snav-osrm")
+            pending: dict = {}
+            next_task = 0
+            try:
+                while next_task < len(via_tasks) or pending:
+                    while (next_task < len(via_tasks) and len(pending) < _OSRM_WORKERS
+                           and time.monotonic() < deadline):
+                        if pending:
                             time.sleep(_OSRM_SUBMIT_DELAY)
+                        pending[pool.submit(_osrm_request, *via_tasks[next_task])] = next_task
+                        next_task += 1
 
-                    for fut in as_completed(futures):
-                        try:
-                            batch_results.extend(fut.result())
-                        except Exception as exc:
-                            log.warning("fetch_routes  via task %d raised: %s",
-                                        futures[fut], exc)
-
-                if batch_results:
-                    all_routes.extend(batch_results)
-                    unique = _dedupe_and_sort_routes(all_routes)
-                    log.debug("fetch_routes  after batch %d → %d unique route(s)",
-                              (batch_start // _OSRM_WORKERS) + 1, len(unique))
-                    if len(unique) >= cap:
+                    remaining = deadline - time.monotonic()
+                    if not pending or remaining <= 0:
+                        log.warning("fetch_routes  OSRM budget exhausted after %d of %d via task(s)",
+                                    next_task - len(pending), len(via_tasks))
+                        break
+                    done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                    if not done:
+                        log.warning("fetch_routes  OSRM budget exhausted waiting on %d via task(s)",
+                                    len(pending))
                         break
 
-                if time.monotonic() >= deadline:
-                    log.warning("fetch_routes  OSRM budget exhausted after batch %d",
-                                (batch_start // _OSRM_WORKERS) + 1)
-                    break
-
-    # ── Step 4: Deduplicate and rank by duration ──────────────────────────
-    unique = _dedupe_and_sort_routes(all_routes)
-
-    result = unique[:cap]
+                    new_routes: list[dict] = []
+                    for fut in done:
+                        task_idx = pending.pop(fut)
+                        try:
+                            new_routes.extend(fut.result())
+                        except Exception as exc:
+                            log.warning("fetch_routes  via task %d raised: %s", task_idx, exc)
+
+                    if new_routes:
+                        all_routes.extend(new_routes)
+                        dedup.add(new_routes)
+                        log.debug("fetch_routes  after via task(s) → %d unique route(s)",
+                                  len(dedup))
+                        if len(dedup) >= cap:
+                            break
+            finally:
+                # Enough routes (or budget spent): drop queued tasks and don't
+                # block on in-flight stragglers — their results are not needed.
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    # ── Step 4: Rank the deduplicated pool by duration ────────────────────
+    result = dedup.fastest()
     log.info("fetch_routes  %d unique route(s) from %d candidates (%.1f km trip)",
              len(result), len(all_routes), dist_km)
     return result
@@ -18,6 +18,7 @@ TAGS assigned after scoring:
 
 import logging
 import math
+from operator import itemgetter
 
 log = logging.getLogger(__name__)
 
@@ -56,6 +57,17 @@ def _safe_div(numerator: float, denominator: float) -> float:
     return numerator / max(denominator, 1e-9)
 
 
+def _round_to(value: float, scale: float) -> float:
+    """
+    Round a non-negative *value* to the nearest ``1 / scale``, halves up.
+
+    Same arithmetic as the browser's fallback scorer
+    (``Math.round(x * scale) / scale``) and several times cheaper than the
+    built-in ``round(x, ndigits)``, which goes through a decimal conversion.
+    """
+    return math.floor(value * scale + 0.5) / scale
+
+
 def _safety_score(distance_m: float, n_coords: int) -> float:
     """
     Highway-proxy safety heuristic.
@@ -116,44 +128,42 @@ def score_routes(routes: list[dict]) -> list[dict]:
     if not routes:
         return []
 
-    # ── Validate and sanitise input routes ────────────────────────────────
-    valid = []
+    # ── Validate input and extract raw per-route metrics in one pass ──────
+    # Validation guarantees distance/duration > 0 and n_coords >= 1, so the
+    # inversions below divide directly instead of going through _safe_div.
+    distances:   list[float] = []      # metres  (kept for tags)
+    durations_s: list[float] = []      # seconds
+    n_coords:    list[int]   = []
+    geometries:  list[list]  = []
     for r in routes:
         try:
             dist = float(r["distance"])
             dur  = float(r["duration"])
-            geo  = r.get("geometry", [])
+            geo  = r.get("geometry")
             if dist <= 0 or dur <= 0:
                 log.warning("score_routes  skipping route with non-positive distance/duration")
                 continue
             if not isinstance(geo, list):
                 geo = []
-            valid.append({**r, "distance": dist, "duration": dur, "geometry": geo})
         except (KeyError, TypeError, ValueError) as exc:
             log.warning("score_routes  skipping malformed route: %s", exc)
-    if not valid:
+            continue
+        distances.append(dist)
+        durations_s.append(dur)
+        n_coords.append(max(len(geo), _MIN_GEOMETRY_LEN))
+        geometries.append(geo)
+    if not distances:
         log.error("score_routes  all routes were invalid")
         return []
-    routes = valid
-    n = len(routes)
-
-    # ── Extract raw per-route metrics ──────────────────────────────────────
-    distances   = [float(r["distance"]) for r in routes]   # metres  (kept for tags)
-    durations_s = [float(r["duration"]) for r in routes]   # seconds
-    n_coords    = [
-        max(len(r.get("geometry", [])), _MIN_GEOMETRY_LEN)
-        for r in routes
-    ]
-    safety_raws = [
-        _safety_score(float(r["distance"]), nc)
-        for r, nc in zip(routes, n_coords)
-    ]
+    n = len(distances)
+
+    safety_raws = [_safety_score(d, nc) for d, nc in zip(distances, n_coords)]
 
     # ── Normalise each dimension to [0, 1] ────────────────────────────────
     # Time / distance: lower is better → invert before normalising
-    inv_duration = [_safe_div(1.0, d) for d in durations_s]
-    inv_distance = [_safe_div(1.0, d) for d in distances]
-    inv_coords   = [_safe_div(1.0, c) for c in n_coords]
+    inv_duration = [1.0 / d for d in durations_s]
+    inv_distance = [1.0 / d for d in distances]
+    inv_coords   = [1.0 / c for c in n_coords]
 
     norm_time     = _minmax_normalise(inv_duration)
     norm_distance = _minmax_normalise(inv_distance)
@@ -162,61 +172,50 @@ def score_routes(routes: list[dict]) -> list[dict]:
 
     # ── Compute composite score ───────────────────────────────────────────
     scores = [
-        round(
+        _round_to(
             (W_TIME       * norm_time[i]
              + W_DISTANCE   * norm_distance[i]
              + W_SAFETY     * norm_safety[i]
              + W_SIMPLICITY * norm_simplicity[i])
             * _SCORE_SCALE,
-            2,
+            100.0,
         )
         for i in range(n)
     ]
 
     log.debug("score_routes  raw scores: %s", scores)
 
-    # ── Build enriched output dicts ───────────────────────────────────────
-    enriched = [
-        {
-            "distance_km":  round(distances[i]   / 1000.0, 2),
-            "duration_min": round(durations_s[i] / 60.0,   1),
-            "score":        scores[i],
-            "geometry":     routes[i].get("geometry", []),
-            "recommended":  False,
-            "tags":         [],
-            # Carried internally for tag assignment; removed before return
-            "_safety_raw":  safety_raws[i],
-        }
-        for i in range(n)
-    ]
-
-    # ── Sort best → worst, mark top route as recommended ─────────────────
-    enriched.sort(key=lambda x: x["score"], reverse=True)
-    enriched[0]["recommended"] = True
-
-    # ── Assign tags ───────────────────────────────────────────────────────
-    min_dur_min  = min(x["duration_min"] for x in enriched)
-    min_dist_km  = min(x["distance_km"]  for x in enriched)
-    max_safety   = max(x["_safety_raw"]  for x in enriched)
-
-    for route in enriched:
+    # ── Tag thresholds, taken over flat lists rather than the output dicts ─
+    distances_km  = [_round_to(d / 1000.0, 100.0) for d in distances]
+    durations_min = [_round_to(d / 60.0,   10.0)  for d in durations_s]
+    min_dist_km   = min(distances_km)
+    min_dur_min   = min(durations_min)
+    max_safety    = max(safety_raws)
+    safest_gap    = _SAFEST_TOLERANCE * max(max_safety, 1e-9)
+
+    # ── Build enriched output dicts with their metric tags ────────────────
+    enriched = []
+    for i in range(n):
         tags: list[str] = []
-
-        if route["recommended"]:
-            tags.append("best")
-
-        if route["duration_min"] == min_dur_min:
+        if durations_min[i] == min_dur_min:
             tags.append("fastest")
-
-        if route["distance_km"] == min_dist_km:
+        if distances_km[i] == min_dist_km:
             tags.append("shortest")
-
-        safety_gap = abs(route["_safety_raw"] - max_safety)
-        if _safe_div(safety_gap, max_safety) < _SAFEST_TOLERANCE:
+        if abs(safety_raws[i] - max_safety) < safest_gap:
             tags.append("safest")
+        enriched.append({
+            "distance_km":  distances_km[i],
+            "duration_min": durations_min[i],
+            "score":        scores[i],
+            "geometry":     geometries[i],
+            "recommended":  False,
+            "tags":         tags,
+        })
 
-        route["tags"] = tags
-        del route["_safety_raw"]    # internal field — never sent to the client
+    # ── Sort best → worst, mark top route as recommended ─────────────────
+    enriched.sort(key=itemgetter("score"), reverse=True)
+    enriched[0]["recommended"] = True
+    enriched[0]["tags"].insert(0, "best")
 
     log.info(
         "score_routes  ranked %d route(s) — best score %.2f, tags: %s",